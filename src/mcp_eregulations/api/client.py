@@ -1,49 +1,128 @@
 """
 API client for interacting with the eRegulations API.
 """
-from typing import Any, Dict, List, Optional
-import httpx
+import asyncio
+import functools
+import itertools
 import logging
+from typing import Any, ClassVar, Dict, List, Optional
+import httpx
+import orjson
 from mcp_eregulations.config.settings import settings
 from mcp_eregulations.utils import subscriptions
 from mcp_eregulations.utils.errors import APIError
+from mcp_eregulations.utils.optimization import Cache
 
 logger = logging.getLogger(__name__)
 
+# Default headers built once; each client instance copies the dict
+_DEFAULT_HEADERS = {
+    "User-Agent": "eregulations-mcp-server/1.0",
+    "Accept": "application/json",
+    # httpx decodes transparently; brotli typically shrinks the larger
+    # JSON payloads (ABC, Totals) 4-6x on the wire
+    "Accept-Encoding": "br, gzip"
+}
+
+# Background notification tasks, referenced here so they are not
+# garbage-collected mid-flight
+_notify_tasks: set = set()
+
+
+def _on_notify_done(task: "asyncio.Task") -> None:
+    """Log and discard a finished background notification task."""
+    _notify_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Subscription notification failed: {task.exception()}")
+
+
+# Pre-bound endpoint templates; {:d} validates the id is an integer and
+# skips the general-purpose f-string formatting machinery
+EP_PROCEDURE = "Procedures/{:d}".format
+EP_RESUME = "Procedures/{:d}/Resume".format
+EP_REQUIREMENTS = "Procedures/{:d}/ABC/Requirements".format
+EP_TOTALS = "Procedures/{:d}/Totals".format
+
+# Shared TTL cache for API responses, keyed by endpoint
+_response_cache = Cache(
+    ttl_seconds=settings.CACHE_TTL,
+    max_size=settings.CACHE_MAX_SIZE
+)
+
+# In-flight request tasks by endpoint: concurrent duplicate requests
+# attach to the existing task instead of hitting the network again
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+# Bounds concurrent network fetches across all client instances, so
+# large gather fan-outs queue beyond this limit instead of saturating
+# the upstream API. HTTP/2 multiplexes many streams over few
+# connections, so the pool's connection limits alone do not cap
+# request concurrency.
+_fetch_semaphore = asyncio.Semaphore(16)
+
 
 class ERegulationsClient:
     """Client for interacting with the eRegulations API."""
-    
+
+    # Single connection pool shared by every client instance (including
+    # DetailedERegulationsClient), so all requests to the API host reuse
+    # one set of keep-alive connections
+    _client: ClassVar[Optional[httpx.AsyncClient]] = None
+
     def __init__(self):
         """Initialize the eRegulations API client."""
+        # Read from the live settings object, not an import-time
+        # snapshot: main.py applies the --api-url/--api-version CLI
+        # overrides onto it after import, and a slotted-dataclass
+        # attribute read is already a cheap C-level lookup
         self.base_url = settings.api_base_url
         self.api_key = settings.EREGULATIONS_API_KEY
-        self.headers = {
-            "User-Agent": "eregulations-mcp-server/1.0",
-            "Accept": "application/json"
-        }
-        
+        self.headers = dict(_DEFAULT_HEADERS)
+
         # Add API key to headers if provided
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
-        
-        # Initialize HTTP client with connection pooling
-        self._client: Optional[httpx.AsyncClient] = None
-    
+
     async def init(self) -> None:
-        """Initialize the HTTP client."""
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
+        """Initialize the shared HTTP client."""
+        if not ERegulationsClient._client:
+            ERegulationsClient._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                timeout=settings.HTTP_TIMEOUT,
                 headers=self.headers,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_TIMEOUT
+                )
             )
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Close the shared HTTP client."""
+        if ERegulationsClient._client:
+            await ERegulationsClient._client.aclose()
+            ERegulationsClient._client = None
+
+    def _fire_and_forget(self, coro) -> None:
+        """
+        Schedule a subscriber notification without blocking the caller.
+
+        Args:
+            coro: The notification coroutine to run in the background
+        """
+        task = asyncio.create_task(coro)
+        _notify_tasks.add(task)
+        task.add_done_callback(_on_notify_done)
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop a cached response so the next request refetches it.
+
+        Args:
+            endpoint: The API endpoint whose cached response to discard
+        """
+        _response_cache.delete(endpoint)
     
     async def make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
         """
@@ -53,25 +132,67 @@ class ERegulationsClient:
             endpoint: The API endpoint to request (without base URL)
             
         Returns:
-            The JSON response as a dictionary, or None if the request failed
-            
+            The JSON response as a dictionary, or None if the resource
+            was not found (404)
+
         Raises:
             APIError: If the API request fails
         """
         if not self._client:
             await self.init()
-        
-        url = f"{self.base_url}/{endpoint}"
-        logger.debug(f"Making request to: {url}")
-        
+
+        # Serve near-static data (procedures, countries, institutions)
+        # from the TTL cache instead of re-hitting the network
+        if settings.CACHE_ENABLED:
+            cached = _response_cache.get(endpoint)
+            if cached is not None:
+                logger.debug(f"Cache hit for endpoint: {endpoint}")
+                return cached
+
+        # Single-flight: collapse concurrent identical requests into one
+        # network operation shared by all callers
+        task = _inflight.get(endpoint)
+        if task is None:
+            task = asyncio.create_task(self._fetch(endpoint))
+            _inflight[endpoint] = task
+            task.add_done_callback(
+                lambda _task, _endpoint=endpoint: _inflight.pop(_endpoint, None)
+            )
+        return await task
+
+    async def _fetch(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Perform the actual GET, parse and cache for make_request."""
+        logger.debug(f"Making request to: {self.base_url}/{endpoint}")
+
         try:
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
+            # The client carries base_url, so relative endpoints reuse the
+            # pooled connections without rebuilding the URL per call.
+            # Only the network operation is bounded by the semaphore;
+            # cache hits and single-flight joins never wait on it.
+            async with _fetch_semaphore:
+                response = await self._client.get(endpoint)
+            # Branch on the status code directly: raise_for_status would
+            # render the full request/response repr even for routine 404s
+            status_code = response.status_code
+            if status_code >= 400:
+                if status_code == 404:
+                    return None
+                raise APIError(
+                    status_code,
+                    response.text[:512],
+                    endpoint=endpoint
+                )
+            # orjson decodes the raw bytes directly, skipping the
+            # bytes -> str -> dict round trip of stdlib json
+            data = orjson.loads(response.content)
+            if settings.CACHE_ENABLED and data is not None:
+                _response_cache.set(endpoint, data)
+            return data
+        except (httpx.TimeoutException, httpx.ConnectError) as e:
+            # Transient transport failures, distinguishable by retry logic
             raise APIError(
-                e.response.status_code,
-                str(e),
+                504,
+                f"Request error: {str(e)}",
                 endpoint=endpoint
             )
         except httpx.RequestError as e:
@@ -80,10 +201,10 @@ class ERegulationsClient:
                 f"Request error: {str(e)}",
                 endpoint=endpoint
             )
-        except Exception as e:
+        except orjson.JSONDecodeError as e:
             raise APIError(
-                500,
-                f"Unexpected error: {str(e)}",
+                502,
+                f"Invalid JSON response: {str(e)}",
                 endpoint=endpoint
             )
     
@@ -97,23 +218,19 @@ class ERegulationsClient:
         Returns:
             The procedure data, or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched successfully
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_PROCEDURE(procedure_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched successfully
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
     async def get_procedure_resume(self, procedure_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -125,23 +242,19 @@ class ERegulationsClient:
         Returns:
             The procedure resume data, or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}/Resume"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched successfully
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}/resume",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_RESUME(procedure_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched successfully
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/resume",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
     async def get_procedure_steps(self, procedure_id: int) -> Optional[List[Dict[str, Any]]]:
         """
@@ -159,18 +272,18 @@ class ERegulationsClient:
         if not procedure_data or "blocks" not in procedure_data:
             return None
         
-        # Extract steps from all blocks
-        steps = []
-        for block in procedure_data.get("blocks", []):
-            steps.extend(block.get("steps", []))
+        # Extract steps from all blocks; chain pushes the iteration to C
+        steps = list(itertools.chain.from_iterable(
+            block.get("steps", ()) for block in procedure_data.get("blocks", ())
+        ))
         
         # Notify subscribers about steps data
         if steps:
-            await subscriptions.subscription_manager.notify_update(
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
                 f"eregulations://procedure/{procedure_id}/steps",
                 steps,
                 mime_type="application/json"
-            )
+            ))
         
         return steps
     
@@ -184,23 +297,19 @@ class ERegulationsClient:
         Returns:
             Requirements data for the procedure, or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}/ABC/Requirements"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched successfully
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}/requirements",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_REQUIREMENTS(procedure_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched successfully
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/requirements",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
     async def get_procedure_costs(self, procedure_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -212,24 +321,40 @@ class ERegulationsClient:
         Returns:
             Cost data for the procedure, or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}/Totals"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched successfully
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}/costs",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_TOTALS(procedure_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched successfully
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/costs",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
+
+
+@functools.lru_cache(maxsize=1)
+def get_client_instance() -> ERegulationsClient:
+    """Return the lazily-created shared client instance."""
+    return ERegulationsClient()
+
+
+# Lock guarding lazy initialization of the shared client
+_client_init_lock = asyncio.Lock()
+
 
+async def get_client() -> ERegulationsClient:
+    """
+    Get the shared client instance, initializing its connection pool once.
 
-# Create a global client instance
-client = ERegulationsClient()
+    Returns:
+        The initialized shared ERegulationsClient
+    """
+    client = get_client_instance()
+    if not client._client:
+        async with _client_init_lock:
+            await client.init()
+    return client
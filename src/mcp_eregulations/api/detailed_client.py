@@ -1,40 +1,74 @@
 """
 Detailed API client with enhanced functionality for eRegulations data.
 """
+import asyncio
+import functools
 import logging
 from typing import Any, Dict, List, Optional
 
 from mcp_eregulations.api.client import ERegulationsClient
+from mcp_eregulations.config.settings import settings
 from mcp_eregulations.utils import subscriptions
 from mcp_eregulations.utils.errors import APIError
+from mcp_eregulations.utils.optimization import cached
 
 logger = logging.getLogger(__name__)
 
+# Pre-bound endpoint templates, mirroring the base client
+EP_ABC = "Procedures/{:d}/ABC".format
+EP_STEP = "Procedures/{:d}/Steps/{:d}".format
+EP_INSTITUTION = "Institutions/{:d}".format
+EP_COUNTRIES = "Countries"
+EP_FULL = "Procedures/{:d}/Full".format
+
 
 class DetailedERegulationsClient(ERegulationsClient):
     """Enhanced client with additional API functionality."""
 
+    # The endpoint cache in make_request already covers the individual
+    # round trips; caching the composite result also skips re-assembly
+    # and the per-section cache probes on repeat invocations. Error
+    # payloads are never stored — the endpoint cache does not cache
+    # failures either, and one transient upstream error must not be
+    # replayed to every caller for the whole TTL.
+    @cached(ttl_seconds=300, should_cache=lambda result: "error" not in result)
     async def get_procedure_detailed(self, procedure_id: int) -> Dict[str, Any]:
         """
         Get comprehensive information about a procedure by combining multiple API calls.
-        
+
         Args:
             procedure_id: The ID of the procedure
-            
+
         Returns:
             Combined procedure information
         """
         try:
+            # Prefer the single server-side composite endpoint when
+            # enabled; one round trip replaces the four-call fan-out
+            if settings.USE_COMPOSITE_ENDPOINT:
+                full = await self.get_procedure_full(procedure_id)
+                if full is not None:
+                    return full
+
             # Get basic procedure data
             basic_info = await self.get_procedure(procedure_id)
             if not basic_info:
                 return {"error": f"Procedure {procedure_id} not found"}
             
-            # Get additional information
-            resume = await self.get_procedure_resume(procedure_id)
-            costs = await self.get_procedure_costs(procedure_id)
-            requirements = await self.get_procedure_requirements(procedure_id)
-            
+            # Fetch the remaining sections concurrently; they are independent
+            # of each other, so latency is bounded by the slowest call.
+            resume, costs, requirements = await asyncio.gather(
+                self.get_procedure_resume(procedure_id),
+                self.get_procedure_costs(procedure_id),
+                self.get_procedure_requirements(procedure_id),
+                return_exceptions=True
+            )
+            resume = None if isinstance(resume, BaseException) else resume
+            costs = None if isinstance(costs, BaseException) else costs
+            requirements = (
+                None if isinstance(requirements, BaseException) else requirements
+            )
+
             # Combine all data
             result = {
                 "basic_info": basic_info,
@@ -44,17 +78,41 @@ class DetailedERegulationsClient(ERegulationsClient):
             }
             
             # Notify subscribers about the combined data
-            await subscriptions.subscription_manager.notify_update(
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
                 f"eregulations://procedure/{procedure_id}/detailed",
                 result,
                 mime_type="application/json"
-            )
+            ))
             
             return result
             
         except APIError as e:
             return {"error": str(e)}
     
+    async def get_procedure_full(self, procedure_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the composite procedure payload in a single request.
+
+        Args:
+            procedure_id: The ID of the procedure
+
+        Returns:
+            Combined procedure data, or None if the endpoint is not
+            available for this deployment
+        """
+        endpoint = EP_FULL(procedure_id)
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers about the combined data
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/detailed",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
+
     async def get_procedure_abc(self, procedure_id: int) -> Optional[Dict[str, Any]]:
         """
         Get Activity-Based Costing analysis for a procedure.
@@ -65,23 +123,19 @@ class DetailedERegulationsClient(ERegulationsClient):
         Returns:
             ABC analysis data or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}/ABC"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}/abc",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_ABC(procedure_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/abc",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
     async def get_step_details(
         self, procedure_id: int, step_id: int
@@ -96,23 +150,19 @@ class DetailedERegulationsClient(ERegulationsClient):
         Returns:
             Step details or None if not found
         """
-        endpoint = f"Procedures/{procedure_id}/Steps/{step_id}"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://procedure/{procedure_id}/step/{step_id}",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_STEP(procedure_id, step_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://procedure/{procedure_id}/step/{step_id}",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
     async def get_institution_details(self, institution_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -124,47 +174,53 @@ class DetailedERegulationsClient(ERegulationsClient):
         Returns:
             Institution details or None if not found
         """
-        endpoint = f"Institutions/{institution_id}"
-        try:
-            data = await self.make_request(endpoint)
-            
-            # Notify subscribers if data was fetched
-            if data:
-                await subscriptions.subscription_manager.notify_update(
-                    f"eregulations://institution/{institution_id}",
-                    data,
-                    mime_type="application/json"
-                )
-            
-            return data
-        except APIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+        endpoint = EP_INSTITUTION(institution_id)
+        # make_request maps 404 to None, so no wrapper is needed here
+        data = await self.make_request(endpoint)
+
+        # Notify subscribers if data was fetched
+        if data:
+            self._fire_and_forget(subscriptions.subscription_manager.notify_update(
+                f"eregulations://institution/{institution_id}",
+                data,
+                mime_type="application/json"
+            ))
+
+        return data
     
+    # The country list is effectively static per deployment, so it gets
+    # a much longer TTL than procedure data
+    @cached(ttl_seconds=86400)
     async def get_countries(self) -> List[Dict[str, Any]]:
         """
         Get list of countries in the eRegulations system.
-        
+
         Returns:
             List of country information
         """
-        endpoint = "Countries"
+        endpoint = EP_COUNTRIES
         try:
             data = await self.make_request(endpoint)
             
             # Notify subscribers about country list updates
             if data:
-                await subscriptions.subscription_manager.notify_update(
+                self._fire_and_forget(subscriptions.subscription_manager.notify_update(
                     "eregulations://countries",
                     data,
                     mime_type="application/json"
-                )
+                ))
             
             return data or []
         except APIError:
             return []
 
 
-# Create a global detailed client instance
-detailed_client = DetailedERegulationsClient()
+@functools.lru_cache(maxsize=1)
+def get_detailed_client() -> DetailedERegulationsClient:
+    """Return the lazily-created shared detailed client instance."""
+    return DetailedERegulationsClient()
+
+
+# Backwards-compatible alias for callers (and tests) that still address
+# the singleton by name
+detailed_client = get_detailed_client()
@@ -2,13 +2,36 @@
 Configuration settings for the MCP eRegulations server.
 """
 import os
+from dataclasses import dataclass, field, fields
 from typing import Optional
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from dotenv import load_dotenv
+
+# Load .env once at import, mirroring the previous BaseSettings behaviour
+load_dotenv()
+
+
+def _coerce(value: str, target_type: type):
+    """Coerce an environment variable string to a settings field type."""
+    if target_type is bool:
+        return value.lower() in ("1", "true", "yes", "on")
+    if target_type is int:
+        return int(value)
+    if target_type is float:
+        return float(value)
+    if target_type is list:
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+@dataclass(slots=True)
+class Settings:
+    """Configuration settings model.
+
+    A plain slotted dataclass: attribute reads are C-level slot lookups
+    with no pydantic validation or descriptor dispatch on the hot path.
+    """
 
-class Settings(BaseSettings):
-    """Configuration settings model."""
-    
     # MCP Server Configuration
     MCP_SERVER_NAME: str = "eregulations"
     MCP_SERVER_PORT: int = 8000
@@ -19,58 +42,71 @@ class Settings(BaseSettings):
     MCP_COMPLETION_TIMEOUT: int = 5  # seconds
     MCP_SUBSCRIPTION_MAX_CLIENTS: int = 100
     MCP_SUBSCRIPTION_TIMEOUT: int = 30  # seconds
-    
+
     # eRegulations API Configuration
     EREGULATIONS_API_URL: str = "https://api.eregulations.org"
     EREGULATIONS_API_VERSION: str = "v1"
     EREGULATIONS_API_KEY: Optional[str] = None
-    
+    # Fetch combined procedure data from the server-side composite
+    # endpoint instead of fanning out per-section requests
+    USE_COMPOSITE_ENDPOINT: bool = False
+
     # Cache Configuration
     CACHE_ENABLED: bool = True
     CACHE_TTL: int = 3600  # 1 hour
     CACHE_MAX_SIZE: int = 1000  # items
-    
+
     # Search Index Configuration
     INDEX_DIR: str = "data/index"
     INDEX_UPDATE_INTERVAL: int = 300  # 5 minutes
-    
+
     # Authentication Configuration
     AUTH_ENABLED: bool = True
     AUTH_TOKEN_EXPIRY: int = 86400  # 24 hours
     AUTH_DATA_DIR: str = "data/auth"
-    
+
     # Monitoring Configuration
     METRICS_ENABLED: bool = True
     METRICS_PORT: int = 9090
-    
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 60  # 1 minute
-    
+
     # HTTP Client Configuration
     HTTP_TIMEOUT: float = 30.0
     HTTP_MAX_RETRIES: int = 3
     HTTP_KEEPALIVE_TIMEOUT: int = 60
     HTTP_MAX_CONNECTIONS: int = 100
-    
+
     # Resource Configuration
     RESOURCE_MAX_SIZE: int = 5 * 1024 * 1024  # 5MB
-    RESOURCE_FORMATS: list[str] = ["text", "json", "markdown"]
-    
+    RESOURCE_FORMATS: list = field(
+        default_factory=lambda: ["text", "json", "markdown"]
+    )
+
     # Computed Properties
     @property
     def api_base_url(self) -> str:
         """Get the complete base URL for the eRegulations API."""
         return f"{self.EREGULATIONS_API_URL}/{self.EREGULATIONS_API_VERSION}"
-    
-    # Configure environment file loading
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=True
-    )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from the environment, coercing types once."""
+        values = {}
+        for f in fields(cls):
+            raw = os.environ.get(f.name)
+            if raw is not None:
+                # Non-class annotations (e.g. Optional[str]) stay strings
+                target = f.type if isinstance(f.type, type) else str
+                values[f.name] = _coerce(raw, target)
+        return cls(**values)
 
 
-# Create global settings instance
-settings = Settings()
+# Create global settings instance. Deliberately left mutable and read
+# through live attribute access everywhere: main.py applies CLI overrides
+# (--api-url/--api-version) onto this instance after import, so snapshots
+# taken at import time would go stale.
+settings = Settings.from_env()
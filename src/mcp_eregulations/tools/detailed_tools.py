@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 
-from mcp_eregulations.api.detailed_client import detailed_client
+from mcp_eregulations.api.detailed_client import get_detailed_client
 from mcp_eregulations.utils.formatters import (
     format_procedure_costs,
     format_procedure_requirements,
@@ -16,235 +16,257 @@ from mcp_eregulations.utils.formatters import (
 
 logger = logging.getLogger(__name__)
 
+# Fixed Markdown headers hoisted to module scope so the formatters below
+# append shared interned strings instead of rebuilding them per call
+_H_DETAILED = "# Detailed Procedure Information\n\n"
+_H_BASIC = "## Basic Information\n\n"
+_H_RESUME = "## Procedure Resume\n\n"
+_H_COSTS = "## Costs\n\n"
+_H_REQS = "## Requirements\n\n"
+_H_ABC = "# Activity-Based Costing (ABC) Analysis\n\n"
+_H_SUMMARY = "## Summary\n\n"
+_H_DETAILS = "## Details\n\n"
+_H_CONTACT = "## Contact Information\n\n"
+_H_LOCATION = "## Location\n\n"
+_H_ONLINE = "## Online Information\n\n"
+_H_INSTITUTION = "# Institution Information\n\n"
+_H_COUNTRIES = "# Available Countries in eRegulations\n\n"
+
+# Block templates with their fallback values: each block is rendered
+# with one format_map call over a defaults-first dict merge, so missing
+# fields fall back without per-field .get() calls
+_CONTACT_DEFAULTS = {
+    "name": "Name not specified",
+    "title": "Title not specified",
+    "email": "Email not specified",
+    "phone": "Phone not specified",
+}
+_CONTACT_TPL = "Name: {name}\nTitle: {title}\nEmail: {email}\nPhone: {phone}\n\n"
+_INST_CONTACT_TPL = "Name: {name}\nEmail: {email}\nPhone: {phone}\n\n"
+_LOCATION_DEFAULTS = {
+    "address": "Address not specified",
+    "city": "City not specified",
+}
+_LOCATION_TPL = "Address: {address}\nCity: {city}\n\n"
+_ONLINE_DEFAULTS = {
+    "url": "URL not specified",
+    "type": "Type not specified",
+}
+_ONLINE_TPL = "URL: {url}\nType: {type}\n\n"
+_COUNTRY_DEFAULTS = {
+    "id": "ID not specified",
+    "name": "Name not specified",
+    "code": "Code not specified",
+}
+_COUNTRY_TPL = "- {name} (ID: {id}, Code: {code})\n"
+
+
+async def get_procedure_detailed(procedure_id: int, ctx: Context = None) -> str:
+    """
+    Get comprehensive information about a procedure by combining multiple API calls.
+
+    Args:
+        procedure_id: The ID of the procedure
+        ctx: The request context
+
+    Returns:
+        Comprehensive formatted procedure information
+    """
+    logger.debug(f"Getting detailed procedure information: {procedure_id}")
+    result = await get_detailed_client().get_procedure_detailed(procedure_id)
+
+    if "error" in result:
+        return result["error"]
+
+    # Format the combined information; collect parts and join once so
+    # concatenation stays linear in the output size
+    parts = [_H_DETAILED]
+
+    # Basic information
+    if "basic_info" in result and result["basic_info"]:
+        parts.append(_H_BASIC)
+        parts.append(format_procedure_summary(result["basic_info"]) + "\n\n")
+
+    # Resume information
+    if "resume" in result and result["resume"]:
+        parts.append(_H_RESUME)
+        title = result["resume"].get("title", "No title available")
+        description = result["resume"].get("description", "No description available")
+        parts.append(f"Title: {title}\n")
+        parts.append(f"Description: {description}\n\n")
+
+    # Cost information
+    if "costs" in result and result["costs"]:
+        parts.append(_H_COSTS)
+        parts.append(format_procedure_costs(result["costs"]) + "\n\n")
+
+    # Requirements information
+    if "requirements" in result and result["requirements"]:
+        parts.append(_H_REQS)
+        parts.append(format_procedure_requirements(result["requirements"]) + "\n\n")
+
+    return "".join(parts)
+
+
+async def get_procedure_abc_analysis(procedure_id: int, ctx: Context = None) -> str:
+    """
+    Get the Activity-Based Costing (ABC) analysis for a procedure.
+
+    Args:
+        procedure_id: The ID of the procedure
+        ctx: The request context
+
+    Returns:
+        Formatted ABC analysis
+    """
+    logger.debug(f"Getting ABC analysis: {procedure_id}")
+    abc_data = await get_detailed_client().get_procedure_abc(procedure_id)
+
+    if not abc_data:
+        return f"ABC analysis not available for procedure with ID {procedure_id}."
+
+    # Format the ABC data
+    parts = [_H_ABC]
+
+    # This formatting will need to be adjusted based on the actual structure of ABC data
+    if "summary" in abc_data:
+        parts.append(_H_SUMMARY)
+        parts.append(f"{abc_data['summary']}\n\n")
+
+    if "details" in abc_data:
+        parts.append(_H_DETAILS)
+        # The generator feeds join directly, keeping the loop in C
+        parts.append("".join(
+            f"- {item.get('name', 'Unnamed item')}:"
+            f" {item.get('cost', 'Cost not specified')}\n"
+            for item in abc_data["details"]
+        ))
+
+    return "".join(parts)
+
+
+async def get_step_details(procedure_id: int, step_id: int, ctx: Context = None) -> str:
+    """
+    Get detailed information about a specific step in a procedure.
+
+    Args:
+        procedure_id: The ID of the procedure
+        step_id: The ID of the step
+        ctx: The request context
+
+    Returns:
+        Formatted step details
+    """
+    logger.debug(f"Getting step details: procedure {procedure_id}, step {step_id}")
+    step_data = await get_detailed_client().get_step_details(procedure_id, step_id)
+
+    if not step_data:
+        return f"Step with ID {step_id} not found for procedure with ID {procedure_id}."
+
+    # Format the step data
+    parts = [f"# Step Details for Step {step_id} in Procedure {procedure_id}\n\n"]
+
+    title = step_data.get("title", f"Step {step_id}")
+    description = step_data.get("description", "No description available")
+
+    parts.append(f"## Title\n{title}\n\n")
+    parts.append(f"## Description\n{description}\n\n")
+
+    # Add contact information if available
+    contact = step_data.get("contact", {})
+    if contact:
+        parts.append(_H_CONTACT)
+        parts.append(_CONTACT_TPL.format_map(_CONTACT_DEFAULTS | contact))
+
+    # Add location information if available
+    location = step_data.get("location", {})
+    if location:
+        parts.append(_H_LOCATION)
+        parts.append(_LOCATION_TPL.format_map(_LOCATION_DEFAULTS | location))
+
+    # Add online information if available
+    online = step_data.get("online", {})
+    if online:
+        parts.append(_H_ONLINE)
+        parts.append(_ONLINE_TPL.format_map(_ONLINE_DEFAULTS | online))
+
+    return "".join(parts)
+
+
+async def get_institution_info(institution_id: int, ctx: Context = None) -> str:
+    """
+    Get information about an institution involved in procedures.
+
+    Args:
+        institution_id: The ID of the institution
+        ctx: The request context
+
+    Returns:
+        Formatted institution details
+    """
+    logger.debug(f"Getting institution information: {institution_id}")
+    institution_data = await get_detailed_client().get_institution_details(institution_id)
+
+    if not institution_data:
+        return f"Institution with ID {institution_id} not found."
+
+    # Format the institution data
+    parts = [_H_INSTITUTION]
+
+    name = institution_data.get("name", "Name not specified")
+    description = institution_data.get("description", "No description available")
+
+    parts.append(f"## Name\n{name}\n\n")
+    parts.append(f"## Description\n{description}\n\n")
+
+    # Add contact information if available
+    contact = institution_data.get("contact", {})
+    if contact:
+        parts.append(_H_CONTACT)
+        parts.append(_INST_CONTACT_TPL.format_map(_CONTACT_DEFAULTS | contact))
+
+    # Add location information if available
+    location = institution_data.get("location", {})
+    if location:
+        parts.append(_H_LOCATION)
+        parts.append(_LOCATION_TPL.format_map(_LOCATION_DEFAULTS | location))
+
+    # Add website if available
+    website = institution_data.get("website")
+    if website:
+        parts.append(f"## Website\n{website}\n\n")
+
+    return "".join(parts)
+
+
+async def list_countries(ctx: Context = None) -> str:
+    """
+    Get a list of countries available in the eRegulations system.
+
+    Args:
+        ctx: The request context
+
+    Returns:
+        Formatted list of countries
+    """
+    logger.debug("Listing countries")
+    countries = await get_detailed_client().get_countries()
+
+    if not countries:
+        return "No countries found in the eRegulations system."
+
+    parts = [_H_COUNTRIES]
+    parts.extend(
+        _COUNTRY_TPL.format_map(_COUNTRY_DEFAULTS | country)
+        for country in countries
+    )
+    return "".join(parts)
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all detailed tools with the MCP server instance."""
-    
-    @mcp.tool()
-    async def get_procedure_detailed(procedure_id: int, ctx: Context = None) -> str:
-        """
-        Get comprehensive information about a procedure by combining multiple API calls.
-        
-        Args:
-            procedure_id: The ID of the procedure
-            ctx: The request context
-            
-        Returns:
-            Comprehensive formatted procedure information
-        """
-        logger.debug(f"Getting detailed procedure information: {procedure_id}")
-        result = await detailed_client.get_procedure_detailed(procedure_id)
-        
-        if "error" in result:
-            return result["error"]
-        
-        # Format the combined information
-        output = "# Detailed Procedure Information\n\n"
-        
-        # Basic information
-        if "basic_info" in result and result["basic_info"]:
-            output += "## Basic Information\n\n"
-            output += format_procedure_summary(result["basic_info"]) + "\n\n"
-        
-        # Resume information
-        if "resume" in result and result["resume"]:
-            output += "## Procedure Resume\n\n"
-            title = result["resume"].get("title", "No title available")
-            description = result["resume"].get("description", "No description available")
-            output += f"Title: {title}\n"
-            output += f"Description: {description}\n\n"
-        
-        # Cost information
-        if "costs" in result and result["costs"]:
-            output += "## Costs\n\n"
-            output += format_procedure_costs(result["costs"]) + "\n\n"
-        
-        # Requirements information
-        if "requirements" in result and result["requirements"]:
-            output += "## Requirements\n\n"
-            output += format_procedure_requirements(result["requirements"]) + "\n\n"
-        
-        return output
-    
-    @mcp.tool()
-    async def get_procedure_abc_analysis(procedure_id: int, ctx: Context = None) -> str:
-        """
-        Get the Activity-Based Costing (ABC) analysis for a procedure.
-        
-        Args:
-            procedure_id: The ID of the procedure
-            ctx: The request context
-            
-        Returns:
-            Formatted ABC analysis
-        """
-        logger.debug(f"Getting ABC analysis: {procedure_id}")
-        abc_data = await detailed_client.get_procedure_abc(procedure_id)
-        
-        if not abc_data:
-            return f"ABC analysis not available for procedure with ID {procedure_id}."
-        
-        # Format the ABC data
-        output = "# Activity-Based Costing (ABC) Analysis\n\n"
-        
-        # This formatting will need to be adjusted based on the actual structure of ABC data
-        if "summary" in abc_data:
-            output += "## Summary\n\n"
-            output += f"{abc_data['summary']}\n\n"
-        
-        if "details" in abc_data:
-            output += "## Details\n\n"
-            for item in abc_data["details"]:
-                name = item.get("name", "Unnamed item")
-                cost = item.get("cost", "Cost not specified")
-                output += f"- {name}: {cost}\n"
-        
-        return output
-    
-    @mcp.tool()
-    async def get_step_details(procedure_id: int, step_id: int, ctx: Context = None) -> str:
-        """
-        Get detailed information about a specific step in a procedure.
-        
-        Args:
-            procedure_id: The ID of the procedure
-            step_id: The ID of the step
-            ctx: The request context
-            
-        Returns:
-            Formatted step details
-        """
-        logger.debug(f"Getting step details: procedure {procedure_id}, step {step_id}")
-        step_data = await detailed_client.get_step_details(procedure_id, step_id)
-        
-        if not step_data:
-            return f"Step with ID {step_id} not found for procedure with ID {procedure_id}."
-        
-        # Format the step data
-        output = f"# Step Details for Step {step_id} in Procedure {procedure_id}\n\n"
-        
-        title = step_data.get("title", f"Step {step_id}")
-        description = step_data.get("description", "No description available")
-        
-        output += f"## Title\n{title}\n\n"
-        output += f"## Description\n{description}\n\n"
-        
-        # Add contact information if available
-        contact = step_data.get("contact", {})
-        if contact:
-            output += "## Contact Information\n\n"
-            contact_name = contact.get("name", "Name not specified")
-            contact_title = contact.get("title", "Title not specified")
-            contact_email = contact.get("email", "Email not specified")
-            contact_phone = contact.get("phone", "Phone not specified")
-            
-            output += f"Name: {contact_name}\n"
-            output += f"Title: {contact_title}\n"
-            output += f"Email: {contact_email}\n"
-            output += f"Phone: {contact_phone}\n\n"
-        
-        # Add location information if available
-        location = step_data.get("location", {})
-        if location:
-            output += "## Location\n\n"
-            address = location.get("address", "Address not specified")
-            city = location.get("city", "City not specified")
-            
-            output += f"Address: {address}\n"
-            output += f"City: {city}\n\n"
-        
-        # Add online information if available
-        online = step_data.get("online", {})
-        if online:
-            output += "## Online Information\n\n"
-            online_url = online.get("url", "URL not specified")
-            online_type = online.get("type", "Type not specified")
-            
-            output += f"URL: {online_url}\n"
-            output += f"Type: {online_type}\n\n"
-        
-        return output
-    
-    @mcp.tool()
-    async def get_institution_info(institution_id: int, ctx: Context = None) -> str:
-        """
-        Get information about an institution involved in procedures.
-        
-        Args:
-            institution_id: The ID of the institution
-            ctx: The request context
-            
-        Returns:
-            Formatted institution details
-        """
-        logger.debug(f"Getting institution information: {institution_id}")
-        institution_data = await detailed_client.get_institution_details(institution_id)
-        
-        if not institution_data:
-            return f"Institution with ID {institution_id} not found."
-        
-        # Format the institution data
-        output = f"# Institution Information\n\n"
-        
-        name = institution_data.get("name", "Name not specified")
-        description = institution_data.get("description", "No description available")
-        
-        output += f"## Name\n{name}\n\n"
-        output += f"## Description\n{description}\n\n"
-        
-        # Add contact information if available
-        contact = institution_data.get("contact", {})
-        if contact:
-            output += "## Contact Information\n\n"
-            contact_name = contact.get("name", "Name not specified")
-            contact_email = contact.get("email", "Email not specified")
-            contact_phone = contact.get("phone", "Phone not specified")
-            
-            output += f"Name: {contact_name}\n"
-            output += f"Email: {contact_email}\n"
-            output += f"Phone: {contact_phone}\n\n"
-        
-        # Add location information if available
-        location = institution_data.get("location", {})
-        if location:
-            output += "## Location\n\n"
-            address = location.get("address", "Address not specified")
-            city = location.get("city", "City not specified")
-            
-            output += f"Address: {address}\n"
-            output += f"City: {city}\n\n"
-        
-        # Add website if available
-        website = institution_data.get("website")
-        if website:
-            output += f"## Website\n{website}\n\n"
-        
-        return output
-    
-    @mcp.tool()
-    async def list_countries(ctx: Context = None) -> str:
-        """
-        Get a list of countries available in the eRegulations system.
-        
-        Args:
-            ctx: The request context
-            
-        Returns:
-            Formatted list of countries
-        """
-        logger.debug("Listing countries")
-        countries = await detailed_client.get_countries()
-        
-        if not countries:
-            return "No countries found in the eRegulations system."
-        
-        output = "# Available Countries in eRegulations\n\n"
-        
-        for country in countries:
-            country_id = country.get("id", "ID not specified")
-            name = country.get("name", "Name not specified")
-            code = country.get("code", "Code not specified")
-            
-            output += f"- {name} (ID: {country_id}, Code: {code})\n"
-        
-        return output
+    mcp.tool()(get_procedure_detailed)
+    mcp.tool()(get_procedure_abc_analysis)
+    mcp.tool()(get_step_details)
+    mcp.tool()(get_institution_info)
+    mcp.tool()(list_countries)
@@ -1,17 +1,58 @@
 """
 Tools for searching and querying eRegulations data.
 """
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 
-from mcp_eregulations.api.detailed_client import detailed_client
+from mcp_eregulations.api.detailed_client import get_detailed_client
 from mcp_eregulations.utils.formatters import format_procedure_summary
 from mcp_eregulations.utils.indexing import index
 
 logger = logging.getLogger(__name__)
 
+# Bounds the fan-out to the upstream API when a search batch has to
+# fetch several procedures that are not yet indexed
+_FETCH_CONCURRENCY = asyncio.Semaphore(8)
+
+
+async def _fetch_procedure(procedure_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch a single procedure under the shared concurrency bound.
+
+    Ids the upstream API has recently reported missing are skipped, and
+    fresh misses are recorded, so stale search hits don't trigger one
+    404 round trip per call.
+    """
+    if index.is_known_missing(procedure_id):
+        return None
+    async with _FETCH_CONCURRENCY:
+        data = await get_detailed_client().get_procedure(procedure_id)
+    if data is None:
+        index.mark_missing(procedure_id)
+    return data
+
+
+def _render_requirements(req_items: List[Dict[str, Any]]):
+    """Yield the requirements listing chunk by chunk.
+
+    Feeding the generator straight into join means only one fragment is
+    materialized at a time alongside the final string.
+    """
+    yield "# Procedure Requirements\n\n"
+
+    for i, req in enumerate(req_items, 1):
+        name = req.get("name", f"Requirement {i}")
+        description = req.get("description", "No description available")
+        cost = req.get("cost", "Cost not specified")
+
+        yield f"{i}. {name}\n"
+        yield f"   Description: {description}\n"
+        if cost:
+            yield f"   Cost: {cost}\n"
+        yield "\n"
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all search-related tools with the MCP server instance."""
@@ -30,42 +71,55 @@ def register_tools(mcp: FastMCP) -> None:
             List of matching procedures with summaries
         """
         logger.debug(f"Searching procedures with keyword: {query}, limit: {limit}")
-        # First check if we have indexed data
-        results = index.search_procedures(query, limit)
-        
-        if results:
-            output = f"# Search Results for '{query}'\n\n"
-            
-            for i, result in enumerate(results, 1):
-                proc_id = result["id"]
-                title = result["title"]
-                
-                output += f"## {i}. {title} (ID: {proc_id})\n"
-                
-                # Get full procedure data from index or API
-                proc_data = index.get_procedure(proc_id)
-                if not proc_data:
-                    # If not in index, fetch from API and index it
-                    proc_data = await detailed_client.get_procedure(proc_id)
-                    if proc_data:
-                        index.index_procedure(proc_id, proc_data)
-                
-                if proc_data:
-                    # Add a brief summary
-                    description = proc_data.get("description", "No description available")
-                    output += f"{description[:200]}...\n\n"
-                    output += f"To get full details, use get_procedure with ID {proc_id}\n\n"
-                else:
-                    output += "Details not available\n\n"
-            
-            return output
-        else:
+        # The scan over the index is CPU-bound; running it on a worker
+        # thread keeps the event loop free for concurrent requests
+        results = await asyncio.to_thread(index.search_procedures, query, limit)
+
+        if not results:
             # If no indexed results, try to fetch some procedures and index them
             # This is a simplified implementation for demonstration
             return (
                 f"No procedures found matching '{query}'. "
                 f"Please try a different search term or use get_procedure with a specific ID."
             )
+
+        # One bulk probe partitions the results into indexed and missing
+        # sets, instead of interleaving per-id lookups with the fetches
+        hit_map = index.get_procedures_bulk([r["id"] for r in results])
+
+        # Pass 1: fetch every procedure missing from the index in one
+        # concurrent batch, so the uncached path costs roughly one round
+        # trip instead of one per result
+        missing = [proc_id for proc_id, data in hit_map.items() if data is None]
+        if missing:
+            fetched = await asyncio.gather(
+                *(_fetch_procedure(proc_id) for proc_id in missing),
+                return_exceptions=True,
+            )
+            for proc_id, proc_data in zip(missing, fetched):
+                if proc_data and not isinstance(proc_data, BaseException):
+                    await index.index_procedure(proc_id, proc_data)
+                    hit_map[proc_id] = proc_data
+
+        # Pass 2: render from the warm hit map; parts are joined once
+        # at the end so concatenation stays linear in the output size
+        parts = [f"# Search Results for '{query}'\n\n"]
+
+        for i, result in enumerate(results, 1):
+            proc_id = result["id"]
+            title = result["title"]
+
+            parts.append(f"## {i}. {title} (ID: {proc_id})\n")
+
+            proc_data = hit_map[proc_id]
+            if proc_data:
+                # Add the brief summary precomputed at index time
+                parts.append(f"{index.get_procedure_summary(proc_id)}\n\n")
+                parts.append(f"To get full details, use get_procedure with ID {proc_id}\n\n")
+            else:
+                parts.append("Details not available\n\n")
+
+        return "".join(parts)
     
     @mcp.tool()
     async def index_procedure_data(procedure_id: int, ctx: Context = None) -> str:
@@ -80,19 +134,24 @@ def register_tools(mcp: FastMCP) -> None:
             Status message
         """
         logger.debug(f"Indexing procedure data: {procedure_id}")
-        # Fetch procedure data
-        procedure_data = await detailed_client.get_procedure(procedure_id)
-        if not procedure_data:
+        # Fetch the procedure and its requirements concurrently; the two
+        # endpoints are independent, so total latency is bounded by the
+        # slower call rather than their sum
+        procedure_data, requirements_data = await asyncio.gather(
+            get_detailed_client().get_procedure(procedure_id),
+            get_detailed_client().get_procedure_requirements(procedure_id),
+            return_exceptions=True,
+        )
+        if isinstance(procedure_data, BaseException) or not procedure_data:
             return f"Procedure with ID {procedure_id} not found."
-        
+
         # Index the procedure
-        index.index_procedure(procedure_id, procedure_data)
-        
-        # Fetch and index requirements
-        requirements_data = await detailed_client.get_procedure_requirements(procedure_id)
-        if requirements_data:
-            index.index_requirements(procedure_id, requirements_data)
-        
+        await index.index_procedure(procedure_id, procedure_data)
+
+        # Index requirements if they were fetched successfully
+        if requirements_data and not isinstance(requirements_data, BaseException):
+            await index.index_requirements(procedure_id, requirements_data)
+
         # Fetch and index related institutions
         # This is a simplified implementation
         # In a real implementation, we would extract institution IDs from the procedure data
@@ -115,10 +174,11 @@ def register_tools(mcp: FastMCP) -> None:
         procedure_data = index.get_procedure(procedure_id)
         
         if not procedure_data:
-            # If not in index, try to fetch and index it
-            procedure_data = await detailed_client.get_procedure(procedure_id)
+            # If not in index, try to fetch and index it; known-missing
+            # ids short-circuit inside _fetch_procedure
+            procedure_data = await _fetch_procedure(procedure_id)
             if procedure_data:
-                index.index_procedure(procedure_id, procedure_data)
+                await index.index_procedure(procedure_id, procedure_data)
             else:
                 return f"Procedure with ID {procedure_id} not found."
         
@@ -141,7 +201,7 @@ def register_tools(mcp: FastMCP) -> None:
         
         if not requirements_data:
             # If not in index, try to fetch and index it
-            requirements_data = await detailed_client.get_procedure_requirements(procedure_id)
+            requirements_data = await get_detailed_client().get_procedure_requirements(procedure_id)
             if requirements_data:
                 index.index_requirements(procedure_id, requirements_data)
             else:
@@ -149,23 +209,10 @@ def register_tools(mcp: FastMCP) -> None:
         
         # Format the requirements data
         # This is a simplified implementation
-        output = "# Procedure Requirements\n\n"
-        
         # Extract requirements from the API response structure
         # This will need to be adjusted based on the actual API response format
         req_items = requirements_data.get("items", [])
         if not req_items:
             return "No specific requirements listed for this procedure."
-        
-        for i, req in enumerate(req_items, 1):
-            name = req.get("name", f"Requirement {i}")
-            description = req.get("description", "No description available")
-            cost = req.get("cost", "Cost not specified")
-            
-            output += f"{i}. {name}\n"
-            output += f"   Description: {description}\n"
-            if cost:
-                output += f"   Cost: {cost}\n"
-            output += "\n"
-        
-        return output
+
+        return "".join(_render_requirements(req_items))
@@ -1,33 +1,66 @@
 """
 Apply performance optimizations to MCP eRegulations tools.
 """
-from mcp.server.fastmcp import FastMCP
+import functools
+from typing import Callable, Dict, List
 
-from mcp_eregulations.utils.optimization import cached, rate_limited, timed
 from mcp_eregulations.main import mcp
-from mcp_eregulations.tools.procedure_tools import get_procedure, get_procedure_steps, get_procedure_requirements, get_procedure_costs
-from mcp_eregulations.tools.detailed_tools import get_procedure_detailed, get_institution_info, get_country_info
-from mcp_eregulations.tools.search_tools import search_procedures_by_keyword
-from mcp_eregulations.tools.query_tools import process_natural_language_query, answer_procedure_question
-
-# Apply caching to frequently used tools
-mcp.tool_registry["get_procedure"] = cached(ttl_seconds=3600)(get_procedure)
-mcp.tool_registry["get_procedure_steps"] = cached(ttl_seconds=3600)(get_procedure_steps)
-mcp.tool_registry["get_procedure_requirements"] = cached(ttl_seconds=3600)(get_procedure_requirements)
-mcp.tool_registry["get_procedure_costs"] = cached(ttl_seconds=3600)(get_procedure_costs)
-mcp.tool_registry["get_procedure_detailed"] = cached(ttl_seconds=3600)(get_procedure_detailed)
-mcp.tool_registry["get_institution_info"] = cached(ttl_seconds=3600)(get_institution_info)
-mcp.tool_registry["get_country_info"] = cached(ttl_seconds=3600)(get_country_info)
-
-# Apply rate limiting to search and query tools
-mcp.tool_registry["search_procedures_by_keyword"] = rate_limited(search_procedures_by_keyword)
-mcp.tool_registry["process_natural_language_query"] = rate_limited(process_natural_language_query)
-mcp.tool_registry["answer_procedure_question"] = rate_limited(answer_procedure_question)
-
-# Apply timing to all tools for performance monitoring
-for name, tool in mcp.tool_registry.items():
-    mcp.tool_registry[name] = timed(tool)
+from mcp_eregulations.utils.optimization import (
+    cached,
+    rate_limited,
+    start_background_tasks,
+    timed,
+)
+
+# Per-tool decorator policies, innermost decorator first. Frequently
+# used lookups get caching and the search/query entry points get rate
+# limiting; every tool gets timing. Tools without an explicit policy
+# fall back to timing only.
+_CACHED_TOOLS = (
+    "get_procedure",
+    "get_procedure_steps",
+    "get_procedure_requirements",
+    "get_procedure_costs",
+    "get_procedure_detailed",
+    "get_institution_info",
+    "list_countries",
+)
+_RATE_LIMITED_TOOLS = (
+    "search_procedures_by_keyword",
+    "process_natural_language_query",
+    "answer_procedure_question",
+)
+
+_DEFAULT_POLICY: List[Callable] = [timed]
+
+_POLICIES: Dict[str, List[Callable]] = {}
+for _name in _CACHED_TOOLS:
+    _POLICIES[_name] = [cached(ttl_seconds=3600), timed]
+for _name in _RATE_LIMITED_TOOLS:
+    _POLICIES[_name] = [rate_limited, timed]
+
+
+def _compose(tool: Callable, decorators: List[Callable]) -> Callable:
+    """Apply a decorator stack to a tool, innermost decorator first."""
+    return functools.reduce(lambda fn, deco: deco(fn), decorators, tool)
+
+
+# Compose each tool's full decorator stack once at registration time, so
+# the per-invocation hot path runs one pre-built wrapper chain instead
+# of decorators being layered in several separate registry rewrites.
+# cached, rate_limited and timed all return functools.wraps-preserving
+# async wrappers, so the composed tools remain recognizable coroutine
+# functions.
+#
+# The registry is rebuilt from a snapshot and swapped in with one
+# clear/update rather than being rewritten slot by slot while iterated.
+_snapshot = list(mcp.tool_registry.items())
+_wrapped = {
+    name: _compose(tool, _POLICIES.get(name, _DEFAULT_POLICY))
+    for name, tool in _snapshot
+}
+mcp.tool_registry.clear()
+mcp.tool_registry.update(_wrapped)
 
 # Start background tasks for maintenance
-from mcp_eregulations.utils.optimization import start_background_tasks
 start_background_tasks()
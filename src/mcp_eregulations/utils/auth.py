@@ -7,11 +7,49 @@ import json
 import logging
 import time
 import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# PBKDF2 parameters for password hashing; the iteration count is stored
+# alongside each hash so it can be raised later without invalidating
+# existing credentials
+_PBKDF2_ALGORITHM = "sha256"
+_PBKDF2_ITERATIONS = 100_000
+
+# The mutation log is compacted into a fresh snapshot once it grows
+# past this size
+_LOG_COMPACT_BYTES = 1 << 20
+
+# Tokens live for 24 hours
+_TOKEN_TTL_SECONDS = 86400
+
+# Successful API-key verifications are cached this long, so the
+# per-request hot path skips the table probe and dict construction
+_VERIFY_CACHE_TTL_SECONDS = 30.0
+
+
+# Failure results for the hot verification paths are shared immutable
+# sentinels: a failed check returns the same mapping every time instead
+# of allocating a fresh dict per call. Success results carry a per-call
+# username, so those are still built (and, for API keys, cached) as
+# plain dicts.
+_INVALID_TOKEN = MappingProxyType({"success": False, "message": "Invalid token"})
+_TOKEN_EXPIRED = MappingProxyType({"success": False, "message": "Token expired"})
+_INVALID_API_KEY = MappingProxyType({"success": False, "message": "Invalid API key"})
+
+
+def _json_default(obj):
+    """Serialize sets as sorted lists in snapshots and log records."""
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class AuthManager:
     """Class for managing authentication and security."""
     
@@ -23,41 +61,129 @@ class AuthManager:
             auth_file: Path to the authentication file
         """
         self.auth_file = auth_file
-        self.users = {}
-        self.api_keys = {}
+        self.log_file = auth_file + ".log"
         self.tokens = {}
-        
-        # Create auth directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.auth_file), exist_ok=True)
-        
-        # Load existing auth data if available
-        self._load_auth_data()
-    
+
+        # Auth data is loaded lazily: the constructor (including the
+        # module-level auth_manager below) touches no files, so imports
+        # that never exercise auth pay no startup I/O
+        self._users = {}
+        self._api_keys = {}
+        self._log_fd = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+        # api_key -> (result, cached_until); punched on revocation
+        self._verify_cache = {}
+
+    def _ensure_loaded(self) -> None:
+        """Load auth data from disk on first access, exactly once."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+
+            # Create auth directory if it doesn't exist
+            os.makedirs(os.path.dirname(self.auth_file), exist_ok=True)
+
+            # Mutations are appended to a write-ahead log; the fd is
+            # opened once so each mutation costs a single write
+            self._log_fd = open(self.log_file, "ab")
+
+            self._load_auth_data()
+            self._loaded = True
+
+    @property
+    def users(self) -> Dict[str, Any]:
+        """The user table, loaded from disk on first access."""
+        self._ensure_loaded()
+        return self._users
+
+    @property
+    def api_keys(self) -> Dict[str, Any]:
+        """The API-key table, loaded from disk on first access."""
+        self._ensure_loaded()
+        return self._api_keys
+
     def _load_auth_data(self):
-        """Load authentication data from file."""
+        """Load authentication data from the snapshot and replay the log."""
         try:
             if os.path.exists(self.auth_file):
                 with open(self.auth_file, "r") as f:
                     data = json.load(f)
-                    self.users = data.get("users", {})
-                    self.api_keys = data.get("api_keys", {})
+                    self._users = data.get("users", {})
+                    self._api_keys = data.get("api_keys", {})
+
+                    # Key collections are serialized as sorted lists but
+                    # held as sets in memory for O(1) membership updates
+                    for user in self._users.values():
+                        user["api_keys"] = set(user.get("api_keys", []))
                     # Don't load tokens from file for security reasons
                     logger.info("Loaded authentication data from file")
+
+            # Replay any mutations logged since the last snapshot
+            if os.path.exists(self.log_file):
+                with open(self.log_file, "r") as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self._apply_record(json.loads(line))
         except Exception as e:
             logger.error(f"Error loading authentication data: {e}")
-    
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one logged mutation record to the in-memory state."""
+        op = record.get("op")
+        if op == "add_user":
+            user = record["user"]
+            user["api_keys"] = set(user.get("api_keys", []))
+            self._users[record["username"]] = user
+        elif op == "add_key":
+            data = record["data"]
+            self._api_keys[record["api_key"]] = data
+            user = self._users.get(data["username"])
+            if user is not None:
+                user["api_keys"].add(record["api_key"])
+        elif op == "del_key":
+            self._api_keys.pop(record["api_key"], None)
+            user = self._users.get(record["username"])
+            if user is not None:
+                user["api_keys"].discard(record["api_key"])
+
+    def _append_log(self, record: Dict[str, Any]) -> None:
+        """Append one mutation record to the write-ahead log."""
+        try:
+            self._log_fd.write(
+                (json.dumps(record, default=_json_default) + "\n").encode()
+            )
+            self._log_fd.flush()
+            os.fsync(self._log_fd.fileno())
+
+            # Fold the log back into a snapshot once it gets large
+            if self._log_fd.tell() >= _LOG_COMPACT_BYTES:
+                self._save_auth_data()
+        except Exception as e:
+            logger.error(f"Error writing authentication log: {e}")
+
     def _save_auth_data(self):
-        """Save authentication data to file."""
+        """Write a fresh snapshot to file and truncate the mutation log."""
         try:
             data = {
                 "users": self.users,
                 "api_keys": self.api_keys
                 # Don't save tokens to file for security reasons
             }
-            
-            with open(self.auth_file, "w") as f:
-                json.dump(data, f, indent=2)
-                
+
+            tmp_file = self.auth_file + ".tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(data, f, indent=2, default=_json_default)
+            os.replace(tmp_file, self.auth_file)
+
+            # The snapshot now covers every logged mutation
+            self._log_fd.seek(0)
+            self._log_fd.truncate()
+
             logger.info("Saved authentication data to file")
         except Exception as e:
             logger.error(f"Error saving authentication data: {e}")
@@ -72,11 +198,14 @@ class AuthManager:
         Returns:
             The hashed password
         """
-        # In a production environment, use a proper password hashing library
-        # like bcrypt or Argon2. This is a simplified implementation.
+        # PBKDF2 with a stored iteration count: the key derivation loop
+        # runs in C inside hashlib and its cost is tunable, unlike the
+        # single-round SHA-256 scheme this replaces
         salt = secrets.token_hex(16)
-        hash_obj = hashlib.sha256((password + salt).encode())
-        return f"{salt}:{hash_obj.hexdigest()}"
+        derived = hashlib.pbkdf2_hmac(
+            _PBKDF2_ALGORITHM, password.encode(), salt.encode(), _PBKDF2_ITERATIONS
+        )
+        return f"pbkdf2:{_PBKDF2_ITERATIONS}:{salt}:{derived.hex()}"
     
     def _verify_password(self, stored_hash: str, password: str) -> bool:
         """
@@ -90,9 +219,20 @@ class AuthManager:
             True if the password matches, False otherwise
         """
         try:
+            if stored_hash.startswith("pbkdf2:"):
+                _, iterations, salt, hash_value = stored_hash.split(":")
+                derived = hashlib.pbkdf2_hmac(
+                    _PBKDF2_ALGORITHM, password.encode(), salt.encode(), int(iterations)
+                )
+                # Constant-time comparison; == would short-circuit on
+                # the first differing byte and leak timing information
+                return hmac.compare_digest(derived.hex(), hash_value)
+
+            # Legacy single-round SHA-256 hashes created before the
+            # PBKDF2 switch
             salt, hash_value = stored_hash.split(":")
             hash_obj = hashlib.sha256((password + salt).encode())
-            return hash_obj.hexdigest() == hash_value
+            return hmac.compare_digest(hash_obj.hexdigest(), hash_value)
         except Exception:
             return False
     
@@ -107,13 +247,14 @@ class AuthManager:
             The authentication token
         """
         token = secrets.token_hex(32)
-        expiry = datetime.now() + timedelta(hours=24)
-        
+
+        # Expiry is stored as a Unix timestamp so verification is a
+        # float comparison, with no datetime parsing on the hot path
         self.tokens[token] = {
             "username": username,
-            "expiry": expiry.isoformat()
+            "expiry": time.time() + _TOKEN_TTL_SECONDS
         }
-        
+
         return token
     
     def _generate_api_key(self) -> str:
@@ -146,12 +287,16 @@ class AuthManager:
         self.users[username] = {
             "password_hash": password_hash,
             "created_at": datetime.now().isoformat(),
-            "api_keys": []
+            "api_keys": set()
         }
-        
-        # Save the updated auth data
-        self._save_auth_data()
-        
+
+        # Log the mutation; cost is one record, not a full-state rewrite
+        self._append_log({
+            "op": "add_user",
+            "username": username,
+            "user": self.users[username]
+        })
+
         return {"success": True, "message": "User registered successfully"}
     
     def authenticate_user(self, username: str, password: str) -> Dict[str, Any]:
@@ -192,23 +337,53 @@ class AuthManager:
         Returns:
             Verification result with username if successful
         """
-        if token not in self.tokens:
-            return {"success": False, "message": "Invalid token"}
-        
-        token_data = self.tokens[token]
-        expiry = datetime.fromisoformat(token_data["expiry"])
-        
-        if datetime.now() > expiry:
+        token_data = self.tokens.get(token)
+        if token_data is None:
+            return _INVALID_TOKEN
+
+        expiry = token_data["expiry"]
+        if isinstance(expiry, str):
+            # Legacy ISO-formatted expiry; parse once and memoize the
+            # timestamp so later checks are a plain float comparison
+            expiry = datetime.fromisoformat(expiry).timestamp()
+            token_data["expiry"] = expiry
+
+        if time.time() > expiry:
             # Token has expired, remove it
             del self.tokens[token]
-            return {"success": False, "message": "Token expired"}
-        
+            return _TOKEN_EXPIRED
+
         return {
             "success": True,
             "message": "Token valid",
             "username": token_data["username"]
         }
     
+    def purge_expired_tokens(self) -> int:
+        """
+        Remove every expired token in a single sweep.
+
+        Expiries are plain floats (see _generate_token), so the sweep is
+        one comparison per token with no parsing or per-entry allocation.
+
+        Returns:
+            Number of tokens removed
+        """
+        now = time.time()
+        expired = []
+        for token, token_data in self.tokens.items():
+            expiry = token_data["expiry"]
+            if isinstance(expiry, str):
+                expiry = datetime.fromisoformat(expiry).timestamp()
+                token_data["expiry"] = expiry
+            if now > expiry:
+                expired.append(token)
+
+        for token in expired:
+            del self.tokens[token]
+
+        return len(expired)
+
     def create_api_key(self, username: str) -> Dict[str, Any]:
         """
         Create a new API key for a user.
@@ -231,11 +406,15 @@ class AuthManager:
             "created_at": datetime.now().isoformat()
         }
         
-        # Add the API key to the user's list
-        self.users[username]["api_keys"].append(api_key)
-        
-        # Save the updated auth data
-        self._save_auth_data()
+        # Add the API key to the user's key set
+        self.users[username]["api_keys"].add(api_key)
+
+        # Log the mutation; cost is one record, not a full-state rewrite
+        self._append_log({
+            "op": "add_key",
+            "api_key": api_key,
+            "data": self.api_keys[api_key]
+        })
         
         return {
             "success": True,
@@ -253,16 +432,22 @@ class AuthManager:
         Returns:
             Verification result with username if successful
         """
-        if api_key not in self.api_keys:
-            return {"success": False, "message": "Invalid API key"}
-        
-        api_key_data = self.api_keys[api_key]
-        
-        return {
+        now = time.time()
+        cached = self._verify_cache.get(api_key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        api_key_data = self.api_keys.get(api_key)
+        if api_key_data is None:
+            return _INVALID_API_KEY
+
+        result = {
             "success": True,
             "message": "API key valid",
             "username": api_key_data["username"]
         }
+        self._verify_cache[api_key] = (result, now + _VERIFY_CACHE_TTL_SECONDS)
+        return result
     
     def revoke_api_key(self, username: str, api_key: str) -> Dict[str, Any]:
         """
@@ -286,14 +471,19 @@ class AuthManager:
         if api_key_data["username"] != username:
             return {"success": False, "message": "API key does not belong to user"}
         
-        # Remove the API key
+        # Remove the API key and punch any cached verification for it
         del self.api_keys[api_key]
+        self._verify_cache.pop(api_key, None)
         
-        # Remove the API key from the user's list
-        self.users[username]["api_keys"].remove(api_key)
-        
-        # Save the updated auth data
-        self._save_auth_data()
+        # Remove the API key from the user's key set in O(1)
+        self.users[username]["api_keys"].discard(api_key)
+
+        # Log the mutation; cost is one record, not a full-state rewrite
+        self._append_log({
+            "op": "del_key",
+            "username": username,
+            "api_key": api_key
+        })
         
         return {"success": True, "message": "API key revoked successfully"}
     
@@ -8,9 +8,43 @@ from mcp import types
 from mcp.server.fastmcp import Context
 
 from mcp_eregulations.utils.errors import InvalidArgumentError
+from mcp_eregulations.utils.optimization import cache
 
 logger = logging.getLogger(__name__)
 
+# Completions fire roughly once per keystroke, so fetched steps (and
+# their lowercased searchable text) are kept briefly to avoid a network
+# round trip per character typed
+_STEPS_CACHE_TTL_SECONDS = 60
+
+# Static fallback suggestions for empty queries, built once on first
+# use instead of reconstructing the Completion objects per request
+_popular_query_completions = None
+
+
+def _get_popular_query_completions() -> tuple:
+    """Build and memoize the static popular-query suggestions."""
+    global _popular_query_completions
+    if _popular_query_completions is None:
+        _popular_query_completions = (
+            types.Completion(
+                label="business registration",
+                detail="Find business registration procedures",
+                documentation="Popular search query"
+            ),
+            types.Completion(
+                label="import license",
+                detail="Find import licensing procedures",
+                documentation="Popular search query"
+            ),
+            types.Completion(
+                label="tax registration",
+                detail="Find tax registration procedures",
+                documentation="Popular search query"
+            )
+        )
+    return _popular_query_completions
+
 
 async def complete_procedure_id(
     ctx: Context,
@@ -88,12 +122,24 @@ async def complete_step_id(
     """
     # Get the API client from context
     client = ctx.request_context.lifespan_context.client
-    
-    # Get procedure steps
-    steps = await client.get_procedure_steps(procedure_id)
-    if not steps:
-        return []
-        
+
+    # Get procedure steps, reusing a recent fetch when available; the
+    # lowercased title/description pairs are cached alongside so the
+    # filter below does no per-keystroke string allocation
+    cache_key = f"complete_steps:{procedure_id}"
+    entry = cache.get(cache_key)
+    if entry is None:
+        steps = await client.get_procedure_steps(procedure_id)
+        if not steps:
+            return []
+        lowered = [
+            (s, s.get("title", "").lower(), s.get("description", "").lower())
+            for s in steps
+        ]
+        entry = (steps, lowered)
+        cache.set(cache_key, entry, _STEPS_CACHE_TTL_SECONDS)
+    steps, lowered = entry
+
     # Filter steps if we have a partial value
     if current_value:
         try:
@@ -101,11 +147,10 @@ async def complete_step_id(
             steps = [s for s in steps if str(s.get("id", "")).startswith(str(step_id))]
         except ValueError:
             # If not a valid ID, try matching title/description
-            current_value = current_value.lower()
+            needle = current_value.lower()
             steps = [
-                s for s in steps
-                if current_value in s.get("title", "").lower()
-                or current_value in s.get("description", "").lower()
+                s for s, title, description in lowered
+                if needle in title or needle in description
             ]
     
     # Convert steps to completion items
@@ -150,24 +195,9 @@ async def complete_query(
             for suggestion in suggestions
         ]
     
-    # Otherwise return popular/example queries
-    return [
-        types.Completion(
-            label="business registration",
-            detail="Find business registration procedures",
-            documentation="Popular search query"
-        ),
-        types.Completion(
-            label="import license",
-            detail="Find import licensing procedures",
-            documentation="Popular search query"
-        ),
-        types.Completion(
-            label="tax registration",
-            detail="Find tax registration procedures",
-            documentation="Popular search query"
-        )
-    ]
+    # Otherwise return popular/example queries; copied so callers that
+    # mutate the returned list cannot touch the shared tuple
+    return list(_get_popular_query_completions())
 
 
 # Completion handler mapping
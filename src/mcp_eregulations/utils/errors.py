@@ -1,12 +1,21 @@
 """
 Custom exception classes for MCP eRegulations server.
 """
+import types
 from typing import Any, Dict, Optional
 
+# Shared read-only mapping for errors raised without data, so the
+# common no-data path allocates no dict per raise
+_EMPTY_DATA = types.MappingProxyType({})
+
 
 class MCPError(Exception):
     """Base class for MCP-specific exceptions."""
 
+    # The attribute set is fixed, so slot descriptors keep per-instance
+    # storage compact and make code/data lookups a fixed-offset read
+    __slots__ = ("code", "data")
+
     def __init__(self, message: str, code: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         """
         Initialize MCP error.
@@ -18,12 +27,14 @@ class MCPError(Exception):
         """
         super().__init__(message)
         self.code = code or "UNKNOWN_ERROR"
-        self.data = data or {}
+        self.data = data if data is not None else _EMPTY_DATA
 
 
 class ResourceNotFoundError(MCPError):
     """Error raised when a requested resource is not found."""
 
+    __slots__ = ()
+
     def __init__(self, resource_id: str, message: Optional[str] = None):
         """
         Initialize resource not found error.
@@ -42,6 +53,8 @@ class ResourceNotFoundError(MCPError):
 class InvalidArgumentError(MCPError):
     """Error raised when an invalid argument is provided."""
 
+    __slots__ = ()
+
     def __init__(self, argument: str, message: Optional[str] = None, value: Any = None):
         """
         Initialize invalid argument error.
@@ -56,7 +69,10 @@ class InvalidArgumentError(MCPError):
             code="INVALID_ARGUMENT",
             data={
                 "argument": argument,
-                "value": str(value) if value is not None else None
+                # Values arriving from MCP clients are usually already
+                # strings, so skip the str() round trip for them
+                "value": value if value is None or isinstance(value, str)
+                else str(value)
             }
         )
 
@@ -64,6 +80,8 @@ class InvalidArgumentError(MCPError):
 class AuthenticationError(MCPError):
     """Error raised when authentication fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: Optional[str] = None):
         """Initialize authentication error."""
         super().__init__(
@@ -75,6 +93,8 @@ class AuthenticationError(MCPError):
 class AuthorizationError(MCPError):
     """Error raised when a user is not authorized to perform an action."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, message: Optional[str] = None):
         """
         Initialize authorization error.
@@ -90,9 +110,31 @@ class AuthorizationError(MCPError):
         )
 
 
+class ConfigurationError(MCPError):
+    """Error raised when server configuration is invalid."""
+
+    __slots__ = ()
+
+    def __init__(self, message: str, setting: Optional[str] = None):
+        """
+        Initialize configuration error.
+
+        Args:
+            message: Error message
+            setting: Optional name of the offending setting
+        """
+        super().__init__(
+            message,
+            code="CONFIGURATION_ERROR",
+            data={"setting": setting}
+        )
+
+
 class APIError(MCPError):
     """Error raised when there's a problem with the eRegulations API."""
 
+    __slots__ = ()
+
     def __init__(self, status_code: int, message: Optional[str] = None, endpoint: Optional[str] = None):
         """
         Initialize API error.
@@ -115,6 +157,8 @@ class APIError(MCPError):
 class IndexError(MCPError):
     """Error raised when there's a problem with the search index."""
 
+    __slots__ = ()
+
     def __init__(self, operation: str, message: Optional[str] = None):
         """
         Initialize index error.
@@ -133,6 +177,8 @@ class IndexError(MCPError):
 class RateLimitError(MCPError):
     """Error raised when rate limits are exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, limit: int, reset_after: int, message: Optional[str] = None):
         """
         Initialize rate limit error.
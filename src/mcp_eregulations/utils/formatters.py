@@ -1,8 +1,54 @@
 """
 Utility functions for formatting and processing eRegulations data.
 """
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+# Matches a /procedure/<id> or /procedures/<id> path segment pair
+_PROC_URL_RE = re.compile(r"(?:^|/)procedures?/(\d+)(?:/|$)", re.IGNORECASE)
+
+# Shared vocabulary of not-found messages, templated once per kind
+_NOT_FOUND_TEMPLATES = {
+    "procedure": "Procedure with ID {id} not found.",
+    "steps": "No steps found for procedure with ID {id}.",
+    "requirements": "No requirements found for procedure with ID {id}.",
+    "costs": "No cost information found for procedure with ID {id}.",
+}
+
+
+def not_found_message(kind: str, procedure_id: int) -> str:
+    """
+    Return the standard not-found message for a procedure resource.
+
+    Args:
+        kind: One of "procedure", "steps", "requirements" or "costs"
+        procedure_id: The ID of the procedure
+
+    Returns:
+        The formatted not-found message
+    """
+    return _NOT_FOUND_TEMPLATES[kind].format(id=procedure_id)
+
+
+# Output templates built once at import; each formatter substitutes into
+# them instead of concatenating line by line per call
+_SUMMARY_TPL = (
+    "Procedure: {title}\n"
+    "URL: {url}\n"
+    "Additional Information: {additional_info}\n"
+    "Number of blocks: {block_count}\n"
+    "Total steps: {step_count}\n"
+)
+_STEP_TPL = (
+    "Step {i}: {title}\n"
+    "Description: {description}\n"
+)
+_REQUIREMENT_TPL = (
+    "{i}. {name}\n"
+    "   Description: {description}\n"
+)
+
 
 def format_procedure_summary(procedure: Dict[str, Any]) -> str:
     """
@@ -17,21 +63,16 @@ def format_procedure_summary(procedure: Dict[str, Any]) -> str:
     if not procedure:
         return "Procedure information not available."
     
-    title = procedure.get("title", "Untitled Procedure")
-    url = procedure.get("url", "No URL available")
-    additional_info = procedure.get("additionalInfo", "No additional information available")
-    
-    summary = f"Procedure: {title}\n"
-    summary += f"URL: {url}\n"
-    summary += f"Additional Information: {additional_info}\n"
-    
-    # Add block and step count if available
     blocks = procedure.get("blocks", [])
-    step_count = sum(len(block.get("steps", [])) for block in blocks)
-    summary += f"Number of blocks: {len(blocks)}\n"
-    summary += f"Total steps: {step_count}\n"
-    
-    return summary
+    return _SUMMARY_TPL.format(
+        title=procedure.get("title", "Untitled Procedure"),
+        url=procedure.get("url", "No URL available"),
+        additional_info=procedure.get(
+            "additionalInfo", "No additional information available"
+        ),
+        block_count=len(blocks),
+        step_count=sum(len(block.get("steps", [])) for block in blocks),
+    )
 
 
 def format_procedure_steps(steps: List[Dict[str, Any]]) -> str:
@@ -46,26 +87,26 @@ def format_procedure_steps(steps: List[Dict[str, Any]]) -> str:
     """
     if not steps:
         return "No steps available for this procedure."
-    
-    result = "Procedure Steps:\n\n"
-    
+
+    parts = ["Procedure Steps:\n\n"]
+
     for i, step in enumerate(steps, 1):
-        title = step.get("title", f"Step {i}")
-        description = step.get("description", "No description available")
-        
-        result += f"Step {i}: {title}\n"
-        result += f"Description: {description}\n"
-        
+        parts.append(_STEP_TPL.format(
+            i=i,
+            title=step.get("title", f"Step {i}"),
+            description=step.get("description", "No description available"),
+        ))
+
         # Add online information if available
         online = step.get("online", {})
         if online:
             online_url = online.get("url")
             if online_url:
-                result += f"Online: {online_url}\n"
-        
-        result += "\n"
-    
-    return result
+                parts.append(f"Online: {online_url}\n")
+
+        parts.append("\n")
+
+    return "".join(parts)
 
 
 def format_procedure_requirements(requirements: Dict[str, Any]) -> str:
@@ -81,26 +122,26 @@ def format_procedure_requirements(requirements: Dict[str, Any]) -> str:
     if not requirements:
         return "No requirements information available for this procedure."
     
-    result = "Procedure Requirements:\n\n"
-    
     # Extract requirements from the API response structure
     # This will need to be adjusted based on the actual API response format
     req_items = requirements.get("items", [])
     if not req_items:
         return "No specific requirements listed for this procedure."
-    
+
+    parts = ["Procedure Requirements:\n\n"]
+
     for i, req in enumerate(req_items, 1):
-        name = req.get("name", f"Requirement {i}")
-        description = req.get("description", "No description available")
+        parts.append(_REQUIREMENT_TPL.format(
+            i=i,
+            name=req.get("name", f"Requirement {i}"),
+            description=req.get("description", "No description available"),
+        ))
         cost = req.get("cost", "Cost not specified")
-        
-        result += f"{i}. {name}\n"
-        result += f"   Description: {description}\n"
         if cost:
-            result += f"   Cost: {cost}\n"
-        result += "\n"
-    
-    return result
+            parts.append(f"   Cost: {cost}\n")
+        parts.append("\n")
+
+    return "".join(parts)
 
 
 def format_procedure_costs(costs: Dict[str, Any]) -> str:
@@ -116,46 +157,38 @@ def format_procedure_costs(costs: Dict[str, Any]) -> str:
     if not costs:
         return "No cost information available for this procedure."
     
-    result = "Procedure Costs:\n\n"
-    
     # Extract cost information from the API response structure
     # This will need to be adjusted based on the actual API response format
     total_cost = costs.get("totalCost", "Not specified")
     currency = costs.get("currency", "")
-    
-    result += f"Total Cost: {total_cost} {currency}\n\n"
-    
+
+    parts = [f"Procedure Costs:\n\nTotal Cost: {total_cost} {currency}\n\n"]
+
     # Add breakdown if available
     cost_items = costs.get("items", [])
     if cost_items:
-        result += "Cost Breakdown:\n"
-        for i, item in enumerate(cost_items, 1):
-            name = item.get("name", f"Item {i}")
-            amount = item.get("amount", "Amount not specified")
-            
-            result += f"{i}. {name}: {amount} {currency}\n"
-    
-    return result
+        parts.append("Cost Breakdown:\n")
+        parts.extend(
+            f"{i}. {item.get('name', f'Item {i}')}:"
+            f" {item.get('amount', 'Amount not specified')} {currency}\n"
+            for i, item in enumerate(cost_items, 1)
+        )
 
+    return "".join(parts)
 
+
+@lru_cache(maxsize=4096)
 def extract_procedure_id_from_url(url: str) -> Optional[int]:
     """
     Extract procedure ID from a URL.
-    
+
     Args:
         url: The URL that might contain a procedure ID
-        
+
     Returns:
         The procedure ID as an integer, or None if not found
     """
-    # This is a simple implementation that assumes URLs like "/procedure/123"
-    # Adjust based on actual URL patterns in the eRegulations platform
-    try:
-        parts = url.strip("/").split("/")
-        for i, part in enumerate(parts):
-            if part.lower() == "procedure" or part.lower() == "procedures":
-                if i + 1 < len(parts) and parts[i + 1].isdigit():
-                    return int(parts[i + 1])
-        return None
-    except Exception:
-        return None
+    # Assumes URLs like "/procedure/123"; the function is pure, so
+    # repeated lookups of the same URL are served from the lru_cache
+    match = _PROC_URL_RE.search(url)
+    return int(match.group(1)) if match else None
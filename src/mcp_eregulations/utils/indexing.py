@@ -5,6 +5,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -12,6 +13,23 @@ import aiofiles
 
 logger = logging.getLogger(__name__)
 
+# Descriptions are truncated to this length for search-result rendering
+_SUMMARY_LENGTH = 200
+
+# Ids found missing upstream are remembered this long before a refetch
+# is allowed, and the negative cache is pruned past this many entries
+_NEGATIVE_TTL_SECONDS = 300
+_NEGATIVE_CACHE_MAX = 10_000
+
+
+def _summarize(description: str) -> str:
+    """Truncate a description for search-result rendering."""
+    if not description:
+        return "No description available"
+    if len(description) > _SUMMARY_LENGTH:
+        return description[:_SUMMARY_LENGTH] + "..."
+    return description
+
 
 class SearchIndex:
     """Class for indexing and retrieving procedure data."""
@@ -37,6 +55,10 @@ class SearchIndex:
         
         # Lock for thread-safe file operations
         self._file_lock = asyncio.Lock()
+
+        # procedure_id -> retry-after timestamp for ids the upstream API
+        # reported as missing, so repeat lookups skip the round trip
+        self._missing = {}
         
         # Create index directory if it doesn't exist
         os.makedirs(self.index_dir, exist_ok=True)
@@ -108,15 +130,21 @@ class SearchIndex:
         # Create searchable text
         searchable_text = f"{title} {description} {additional_info}".lower()
         
-        # Store in index with metadata
+        # Store in index with metadata; the render-time summary is
+        # precomputed here so search hits read one field instead of
+        # re-slicing a potentially large description on every render
         self.procedures_index[str(procedure_id)] = {
             "id": procedure_id,
             "title": title,
             "searchable_text": searchable_text,
+            "summary": _summarize(description),
             "last_updated": datetime.now().isoformat(),
             "data": procedure_data
         }
-        
+
+        # The procedure evidently exists now
+        self._missing.pop(procedure_id, None)
+
         # Index steps if available
         blocks = procedure_data.get("blocks", [])
         for block in blocks:
@@ -216,9 +244,12 @@ class SearchIndex:
         """
         query = query.lower()
         results = []
-        
-        # Simple search implementation
-        for proc_id, proc_data in self.procedures_index.items():
+
+        # Simple search implementation. The scan walks a snapshot of the
+        # values: callers may run it on a worker thread (asyncio.to_thread)
+        # while the event loop indexes new procedures into the same dict,
+        # and iterating the live dict would raise mid-scan.
+        for proc_data in list(self.procedures_index.values()):
             if query in proc_data["searchable_text"]:
                 results.append({
                     "id": proc_data["id"],
@@ -245,6 +276,82 @@ class SearchIndex:
             return proc_data["data"]
         return None
     
+    def get_procedures_bulk(
+        self, procedure_ids: List[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get several procedures from the index in a single pass.
+
+        Args:
+            procedure_ids: The IDs of the procedures
+
+        Returns:
+            Mapping of procedure ID to its data, or None where the
+            procedure is not indexed
+        """
+        procedures = self.procedures_index
+        result = {}
+        for procedure_id in procedure_ids:
+            entry = procedures.get(str(procedure_id))
+            result[procedure_id] = entry["data"] if entry else None
+        return result
+
+    def mark_missing(self, procedure_id: int) -> None:
+        """
+        Remember that a procedure does not exist upstream.
+
+        Args:
+            procedure_id: The ID the upstream API reported as missing
+        """
+        now = time.time()
+        if len(self._missing) > _NEGATIVE_CACHE_MAX:
+            # Prune lazily so the negative cache stays bounded
+            self._missing = {
+                proc_id: deadline
+                for proc_id, deadline in self._missing.items()
+                if deadline > now
+            }
+        self._missing[procedure_id] = now + _NEGATIVE_TTL_SECONDS
+
+    def is_known_missing(self, procedure_id: int) -> bool:
+        """
+        Check whether a procedure was recently reported missing upstream.
+
+        Args:
+            procedure_id: The ID of the procedure
+
+        Returns:
+            True if a refetch should be skipped for now
+        """
+        deadline = self._missing.get(procedure_id)
+        if deadline is None:
+            return False
+        if deadline <= time.time():
+            del self._missing[procedure_id]
+            return False
+        return True
+
+    def get_procedure_summary(self, procedure_id: int) -> Optional[str]:
+        """
+        Get the precomputed short summary for an indexed procedure.
+
+        Args:
+            procedure_id: The ID of the procedure
+
+        Returns:
+            The truncated description, or None if not indexed
+        """
+        entry = self.procedures_index.get(str(procedure_id))
+        if entry is None:
+            return None
+
+        summary = entry.get("summary")
+        if summary is None:
+            # Entry written before summaries were precomputed
+            summary = _summarize(entry["data"].get("description", ""))
+            entry["summary"] = summary
+        return summary
+
     def get_step(self, procedure_id: int, step_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a step from the index.
@@ -310,19 +310,24 @@ def log_access(func: Callable) -> Callable:
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
+        # Skip the key lookup and message formatting entirely when the
+        # record would be dropped anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return await func(*args, **kwargs)
+
         # Extract authentication information from context
         api_key = kwargs.get("api_key")
-        
+
         if api_key:
             result = auth_manager.verify_api_key(api_key)
             username = result.get("username", "unknown") if result.get("success") else "unknown"
         else:
             username = "anonymous"
-        
+
         # Log the access
         logger.info(f"Access to {func.__name__} by {username}")
-        
+
         # Proceed with the function call
         return await func(*args, **kwargs)
-    
+
     return wrapper
@@ -6,6 +6,7 @@ import time
 import asyncio
 import logging
 import functools
+from array import array
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -13,15 +14,18 @@ logger = logging.getLogger(__name__)
 class Cache:
     """Simple in-memory cache with TTL."""
     
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, max_size: Optional[int] = None):
         """
         Initialize the cache.
-        
+
         Args:
             ttl_seconds: Time-to-live in seconds for cache entries
+            max_size: Optional maximum number of entries; the oldest entry
+                is evicted when the cache is full
         """
         self.cache = {}
         self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -55,7 +59,15 @@ class Cache:
         """
         ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
         expiry = datetime.now() + timedelta(seconds=ttl)
-        
+
+        # Evict the oldest entry when full (dicts preserve insertion order)
+        if (
+            self.max_size is not None
+            and key not in self.cache
+            and len(self.cache) >= self.max_size
+        ):
+            del self.cache[next(iter(self.cache))]
+
         self.cache[key] = {
             "value": value,
             "expiry": expiry
@@ -71,6 +83,27 @@ class Cache:
         if key in self.cache:
             del self.cache[key]
     
+    def evict_prefix(self, prefix: str) -> int:
+        """
+        Delete all entries whose key starts with the given prefix.
+
+        The cached decorator keys entries as "funcname:args", so passing
+        "funcname:" (with the trailing separator) scopes the eviction to
+        that function. A bare name would also sweep functions whose
+        names merely extend it, such as get_procedure_detailed when
+        evicting for get_procedure.
+
+        Args:
+            prefix: Key prefix to match
+
+        Returns:
+            Number of entries removed
+        """
+        matching = [key for key in self.cache if key.startswith(prefix)]
+        for key in matching:
+            del self.cache[key]
+        return len(matching)
+
     def clear(self) -> None:
         """Clear all entries from the cache."""
         self.cache.clear()
@@ -98,13 +131,19 @@ class Cache:
 cache = Cache()
 
 
-def cached(ttl_seconds: Optional[int] = None) -> Callable:
+def cached(
+    ttl_seconds: Optional[int] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None
+) -> Callable:
     """
     Decorator to cache function results.
-    
+
     Args:
         ttl_seconds: Optional custom TTL in seconds
-        
+        should_cache: Optional predicate deciding whether a result is
+            stored; lets callers skip failure-shaped results so a
+            transient error is not replayed until the TTL lapses
+
     Returns:
         Decorated function with caching
     """
@@ -127,9 +166,10 @@ def cached(ttl_seconds: Optional[int] = None) -> Callable:
             logger.debug(f"Cache miss for {cache_key}")
             result = await func(*args, **kwargs)
             
-            # Cache the result
-            cache.set(cache_key, result, ttl_seconds)
-            
+            # Cache the result unless the predicate rejects it
+            if should_cache is None or should_cache(result):
+                cache.set(cache_key, result, ttl_seconds)
+
             return result
         
         return wrapper
@@ -289,29 +329,95 @@ def rate_limited(func: Callable) -> Callable:
     return wrapper
 
 
+# Number of duration samples retained per timed function
+_TIMING_RING_SIZE = 1024
+
+
+class _TimingRing:
+    """Fixed-size ring buffer of call durations in nanoseconds."""
+
+    __slots__ = ("samples", "next_slot", "count")
+
+    def __init__(self):
+        # Preallocated once; recording a sample is two index writes
+        # with no per-call allocation
+        self.samples = array("Q", [0]) * _TIMING_RING_SIZE
+        self.next_slot = 0
+        self.count = 0
+
+    def append_ns(self, duration_ns: int) -> None:
+        """Record one duration, overwriting the oldest when full."""
+        self.samples[self.next_slot] = duration_ns
+        self.next_slot = (self.next_slot + 1) % _TIMING_RING_SIZE
+        if self.count < _TIMING_RING_SIZE:
+            self.count += 1
+
+
+# Per-function timing rings, keyed by function name
+_timing_stats: Dict[str, _TimingRing] = {}
+
+
+def get_timing_stats(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Get aggregate timing statistics for a timed function.
+
+    Percentiles are computed here, on demand, rather than on the hot
+    path that records samples.
+
+    Args:
+        name: Name of the timed function
+
+    Returns:
+        Statistics (count, average and percentiles in seconds), or
+        None if the function has not recorded any samples
+    """
+    ring = _timing_stats.get(name)
+    if ring is None or ring.count == 0:
+        return None
+
+    samples = sorted(ring.samples[:ring.count])
+    count = len(samples)
+    return {
+        "count": count,
+        "avg_seconds": sum(samples) / count / 1e9,
+        "p50_seconds": samples[count // 2] / 1e9,
+        "p95_seconds": samples[(count * 95) // 100] / 1e9,
+    }
+
+
 def timed(func: Callable) -> Callable:
     """
     Decorator to measure function execution time.
-    
+
     Args:
         func: The function to decorate
-        
+
     Returns:
         Decorated function with timing
     """
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
-        
+        # perf_counter_ns is monotonic and integer-valued, avoiding the
+        # float conversion and wall-clock jumps of time.time()
+        start_ns = time.perf_counter_ns()
+
         # Call the function
         result = await func(*args, **kwargs)
-        
-        # Calculate execution time
-        execution_time = time.time() - start_time
-        logger.info(f"{func.__name__} executed in {execution_time:.4f} seconds")
-        
+
+        duration_ns = time.perf_counter_ns() - start_ns
+
+        ring = _timing_stats.get(func.__name__)
+        if ring is None:
+            ring = _timing_stats[func.__name__] = _TimingRing()
+        ring.append_ns(duration_ns)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{func.__name__} executed in {duration_ns / 1e9:.4f} seconds"
+            )
+
         return result
-    
+
     return wrapper
 
 
@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Any
 import logging
 import re
 
-from mcp_eregulations.api.detailed_client import detailed_client
+from mcp_eregulations.api.detailed_client import get_detailed_client
 from mcp_eregulations.utils.indexing import index
 
 logger = logging.getLogger(__name__)
@@ -149,7 +149,7 @@ class QueryHandler:
             procedure_data = index.get_procedure(procedure_id)
             if not procedure_data:
                 # If not in index, fetch from API
-                procedure_data = await detailed_client.get_procedure(procedure_id)
+                procedure_data = await get_detailed_client().get_procedure(procedure_id)
                 if procedure_data:
                     # Index for future use
                     index.index_procedure(procedure_id, procedure_data)
@@ -3,6 +3,7 @@ Resource subscription management for MCP server.
 """
 import asyncio
 import logging
+import orjson
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
@@ -115,21 +116,33 @@ class SubscriptionManager:
         
         Args:
             resource_id: The ID of the updated resource
-            content: The new content of the resource
+            content: The new content of the resource, either structured
+                data or pre-serialized bytes
             mime_type: Optional MIME type of the content
         """
         async with self._lock:
             now = datetime.now()
-            
+            payload = None
+
             # Find matching patterns
             for pattern, subs in self._subscriptions.items():
                 if self._matches_pattern(resource_id, pattern):
+                    # Serialize once and share the immutable payload across
+                    # all subscribers instead of serializing per notification
+                    if payload is None:
+                        if mime_type == "application/json" and not isinstance(
+                            content, (bytes, str)
+                        ):
+                            payload = orjson.dumps(content)
+                        else:
+                            payload = content
+
                     # Notify each subscriber
                     for sub in subs:
                         try:
                             await sub.context.notify_resource_changed(
                                 resource_id,
-                                content,
+                                payload,
                                 mime_type=mime_type
                             )
                             sub.last_notified = now
@@ -41,17 +41,21 @@ class TestAuthManager:
         """Test password hashing."""
         password = "test_password"
         hashed = auth_manager._hash_password(password)
-        
+
         # Check that the hash is in the expected format
-        assert ":" in hashed
-        salt, hash_value = hashed.split(":")
+        assert hashed.startswith("pbkdf2:")
+        _, iterations, salt, hash_value = hashed.split(":")
+        assert int(iterations) > 0
         assert len(salt) > 0
         assert len(hash_value) > 0
-        
-        # Check that the same password with the same salt produces the same hash
+
+        # Check that the same password with the same salt and iteration
+        # count produces the same hash
         import hashlib
-        hash_obj = hashlib.sha256((password + salt).encode())
-        assert hash_obj.hexdigest() == hash_value
+        derived = hashlib.pbkdf2_hmac(
+            "sha256", password.encode(), salt.encode(), int(iterations)
+        )
+        assert derived.hex() == hash_value
     
     def test_verify_password(self, auth_manager):
         """Test password verification."""
@@ -66,6 +70,13 @@ class TestAuthManager:
         
         # Invalid hash format should not verify
         assert auth_manager._verify_password("invalid_hash", password) is False
+
+        # Legacy SHA-256 hashes created before the PBKDF2 switch should
+        # still verify
+        import hashlib
+        salt = "legacy_salt"
+        legacy_hash = f"{salt}:{hashlib.sha256((password + salt).encode()).hexdigest()}"
+        assert auth_manager._verify_password(legacy_hash, password) is True
     
     def test_generate_token(self, auth_manager):
         """Test token generation."""
@@ -170,6 +181,23 @@ class TestAuthManager:
         # Check that the expired token was removed
         assert token not in auth_manager.tokens
     
+    def test_purge_expired_tokens(self, auth_manager):
+        """Test sweeping expired tokens."""
+        import time
+
+        # Create one valid and one expired token
+        valid_token = auth_manager._generate_token("test_user")
+        expired_token = auth_manager._generate_token("other_user")
+        auth_manager.tokens[expired_token]["expiry"] = time.time() - 1
+
+        # Sweep expired tokens
+        removed = auth_manager.purge_expired_tokens()
+
+        # Check that only the expired token was removed
+        assert removed == 1
+        assert valid_token in auth_manager.tokens
+        assert expired_token not in auth_manager.tokens
+
     def test_create_api_key(self, auth_manager):
         """Test API key creation."""
         # Register a user